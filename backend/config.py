@@ -1,15 +1,18 @@
 """Configuration for the LLM Council."""
 
 import os
-import json
 import logging
 from pathlib import Path
 from dotenv import load_dotenv
+from . import jsonutil
 
 logger = logging.getLogger('council.config')
 
 load_dotenv()
 
+# Level of the council's loggers (DEBUG adds per-response and per-wakeup detail)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
 # OpenRouter API key
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 
@@ -21,6 +24,49 @@ else:
 
 # OpenRouter API endpoint
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+OPENROUTER_MODELS_URL = "https://openrouter.ai/api/v1/models"
+
+# Maximum number of concurrent model requests per council stage (avoids provider 429s)
+COUNCIL_MAX_CONCURRENCY = int(os.getenv("COUNCIL_MAX_CONCURRENCY", "8"))
+STAGE1_MAX_CONCURRENCY = int(os.getenv("STAGE1_MAX_CONCURRENCY", str(COUNCIL_MAX_CONCURRENCY)))
+STAGE2_MAX_CONCURRENCY = int(os.getenv("STAGE2_MAX_CONCURRENCY", str(COUNCIL_MAX_CONCURRENCY)))
+
+# Maximum number of model requests in flight across the whole process - all jobs,
+# stages, debates and title generation together
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+
+# Start the round-robin debate speaker alongside the moderator call; costs an
+# extra (cancelled) request on turns where the moderator picks someone else
+DEBATE_SPECULATIVE_PREFETCH = os.getenv("DEBATE_SPECULATIVE_PREFETCH", "true").lower() in ("1", "true", "yes")
+
+# Debate prompts include only this many most recent turns verbatim; older turns
+# are condensed by the moderator into a running summary (0 = keep everything)
+DEBATE_HISTORY_WINDOW = int(os.getenv("DEBATE_HISTORY_WINDOW", "6"))
+
+# Per-stage time limits in seconds (0 = no limit). When Stage 1's limit passes the
+# council continues with the responses it has; Stage 2 or 3 running over fails the job
+STAGE1_TIMEOUT_SECONDS = float(os.getenv("STAGE1_TIMEOUT_SECONDS", "120"))
+STAGE2_TIMEOUT_SECONDS = float(os.getenv("STAGE2_TIMEOUT_SECONDS", "180"))
+STAGE3_TIMEOUT_SECONDS = float(os.getenv("STAGE3_TIMEOUT_SECONDS", "300"))
+
+# Send the chairman the Stage 1 part of its prompt while Stage 2 runs, marked for
+# provider prompt caching, so Stage 3 only pays for the rankings (extra request;
+# only helps with providers that honor cache_control, e.g. Anthropic)
+STAGE3_PROMPT_PREWARM = os.getenv("STAGE3_PROMPT_PREWARM", "false").lower() in ("1", "true", "yes")
+
+# Cancel a council job when the client streaming it disconnects; by default jobs keep
+# running so a reloaded page can pick them up again
+CANCEL_ON_DISCONNECT = os.getenv("CANCEL_ON_DISCONNECT", "false").lower() in ("1", "true", "yes")
+
+# Streamed chunks are batched for this long before being applied to a job, so a
+# token stream costs one update (and one SSE wakeup) per batch (0 = no batching)
+STREAM_BATCH_MS = int(os.getenv("STREAM_BATCH_MS", "20"))
+# A batch is also flushed early once it holds this many chunks. The size starts at
+# the minimum and is multiplied by the growth factor per flush, up to the maximum,
+# so the first tokens of a response show right away
+STREAM_MIN_BATCH_SIZE = int(os.getenv("STREAM_MIN_BATCH_SIZE", "1"))
+STREAM_BATCH_GROWTH = int(os.getenv("STREAM_BATCH_GROWTH", "3"))
+STREAM_MAX_BATCH_SIZE = int(os.getenv("STREAM_MAX_BATCH_SIZE", "50"))
 
 # Data directory for conversation storage
 DATA_DIR = "data/conversations"
@@ -28,6 +74,9 @@ DATA_DIR = "data/conversations"
 # Config file path for persistent council configuration
 CONFIG_FILE = "data/council_config.json"
 
+# Parsed council config, reloaded only when the file's mtime changes
+_CACHE = {"mtime": None, "data": None}
+
 
 def _ensure_config_dir():
     """Ensure the config directory exists."""
@@ -35,16 +84,27 @@ def _ensure_config_dir():
 
 
 def _load_council_config():
-    """Load council configuration from persistent storage."""
-    _ensure_config_dir()
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
-    # Return empty config if no file exists - user must configure
-    return {"council_models": [], "chairman_model": ""}
+    """
+    Load council configuration from persistent storage.
+    The parsed file is cached in memory and only re-read when its mtime changes.
+    """
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        # Return empty config if no file exists - user must configure
+        return {"council_models": [], "chairman_model": ""}
+
+    if _CACHE["mtime"] == mtime:
+        return _CACHE["data"]
+
+    try:
+        data = jsonutil.loads(Path(CONFIG_FILE).read_bytes())
+    except (jsonutil.JSONDecodeError, IOError):
+        return {"council_models": [], "chairman_model": ""}
+
+    _CACHE["mtime"] = mtime
+    _CACHE["data"] = data
+    return data
 
 
 def save_council_config(council_models: list, chairman_model: str):
@@ -54,8 +114,9 @@ def save_council_config(council_models: list, chairman_model: str):
         "council_models": council_models,
         "chairman_model": chairman_model
     }
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    Path(CONFIG_FILE).write_bytes(jsonutil.dumps_pretty(config))
+    # Invalidate the cache so the next read picks up the new file
+    _CACHE["mtime"] = None
 
 
 def get_council_models():
@@ -69,6 +130,7 @@ def get_chairman_model():
 
 
 # For backward compatibility - these will be updated dynamically
+_ensure_config_dir()
 _config = _load_council_config()
 COUNCIL_MODELS = _config.get("council_models", [])
 CHAIRMAN_MODEL = _config.get("chairman_model", "")
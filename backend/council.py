@@ -1,17 +1,98 @@
 """3-stage LLM Council orchestration."""
 
 import asyncio
+import re
 from typing import List, Dict, Any, Tuple, Callable, Optional
-from .openrouter import query_model, stream_model, query_models_parallel
+from .openrouter import query_model, query_model_prebuilt, stream_model, stream_model_prebuilt, query_models_parallel
+from . import jsonutil
 from . import config
 
+# Ranking parsers: numbered entries ("1. Response A") and bare labels
+_NUMBERED_RE = re.compile(r'\d+\.\s*(Response [A-Z])')
+_RESPONSE_RE = re.compile(r'Response [A-Z]')
+
+# Anonymized response labels, built once ("Response A", "Response B", ...)
+_LABELS = tuple(f"Response {chr(65 + i)}" for i in range(26))
+
+# Static prompt scaffolding; the builders join these with the per-request text
+_RANKING_PROMPT_HEAD = "You are evaluating different responses to the following question:\n\nQuestion: "
+_RANKING_PROMPT_RESPONSES = "\n\nHere are the responses from different models (anonymized):\n\n"
+_RANKING_PROMPT_TAIL = """
+
+Your task:
+1. First, evaluate each response individually. For each response, explain what it does well and what it does poorly.
+2. Then, at the very end of your response, provide a final ranking.
+
+IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
+- Start with the line "FINAL RANKING:" (all caps, with colon)
+- Then list the responses from best to worst as a numbered list
+- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
+- Do not add any other text or explanations in the ranking section
+
+Example of the correct format for your ENTIRE response:
+
+Response A provides good detail on X but misses Y...
+Response B is accurate but lacks depth on Z...
+Response C offers the most comprehensive answer...
+
+FINAL RANKING:
+1. Response C
+2. Response A
+3. Response B
+
+Now provide your evaluation and ranking:"""
+
+_CHAIRMAN_SINGLE_HEAD = "You are the Chairman of an LLM Council. A single model has provided a response to the user's question.\n\nOriginal Question: "
+_CHAIRMAN_SINGLE_RESPONSES = "\n\nCOUNCIL MEMBER RESPONSE:\n"
+_CHAIRMAN_SINGLE_TAIL = """
+
+Your task as Chairman is to review this response and provide a refined, comprehensive answer. Consider:
+- The strengths and weaknesses of the provided response
+- Any gaps or areas that could be improved
+- Providing additional context or clarification where helpful
+
+Provide a clear, well-reasoned final answer:"""
+
+_CHAIRMAN_MULTI_HEAD = "You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question, and then ranked each other's responses.\n\nOriginal Question: "
+_CHAIRMAN_MULTI_RESPONSES = "\n\nSTAGE 1 - Individual Responses:\n"
+_CHAIRMAN_MULTI_RANKINGS = "\n\nSTAGE 2 - Peer Rankings:\n"
+_CHAIRMAN_MULTI_TAIL = """
+
+Your task as Chairman is to synthesize all of this information into a single, comprehensive, accurate answer to the user's original question. Consider:
+- The individual responses and their insights
+- The peer rankings and what they reveal about response quality
+- Any patterns of agreement or disagreement
+
+Provide a clear, well-reasoned final answer that represents the council's collective wisdom:"""
+
+# Bound concurrent model requests per stage so large councils don't trip provider rate limits
+_STAGE1_SEM = asyncio.Semaphore(config.STAGE1_MAX_CONCURRENCY)
+_STAGE2_SEM = asyncio.Semaphore(config.STAGE2_MAX_CONCURRENCY)
+
+
+# Strong references to fire-and-forget cleanup tasks so they are not garbage collected
+_BACKGROUND_TASKS: set = set()
+
+
+async def _drain_cancelled(tasks):
+    """Wait for cancelled tasks to finish unwinding, ignoring their results."""
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _cancel_when_set(event: asyncio.Event, task: asyncio.Task):
+    """Cancel a task as soon as the given event is set."""
+    await event.wait()
+    task.cancel()
+
 
 async def stage1_collect_responses_streaming(
     user_query: str,
     on_chunk: Optional[Callable[[str, str], None]] = None,  # (model, chunk)
     on_model_complete: Optional[Callable[[str, bool], None]] = None,
-    should_skip_model: Optional[Callable[[str], bool]] = None,  # Check if model should be skipped
-    should_force_continue: Optional[Callable[[], bool]] = None,  # Check if we should stop early
+    skip_events: Optional[Dict[str, asyncio.Event]] = None,  # model -> set when the model is skipped
+    stop_event: Optional[asyncio.Event] = None,  # Set to stop waiting and continue early
+    models: Optional[List[str]] = None,
+    control_event: Optional[asyncio.Event] = None,  # Set whenever a skip or stop event is set
 ) -> List[Dict[str, Any]]:
     """
     Stage 1: Collect individual responses from all council models with streaming.
@@ -21,27 +102,30 @@ async def stage1_collect_responses_streaming(
         user_query: The user's question
         on_chunk: Optional callback(model_name, text_chunk) called for each chunk
         on_model_complete: Optional callback(model_name, success) called when each model finishes
-        should_skip_model: Optional callback(model_name) -> bool to check if model should be skipped
-        should_force_continue: Optional callback() -> bool to check if we should stop waiting
+        skip_events: Optional per-model events; setting one cancels that model's stream
+        stop_event: Optional event; setting it stops waiting for the remaining models
+        models: Council models to query (defaults to the configured council)
+        control_event: Optional event set along with any skip or stop event; when
+            given, it is the only one watched, instead of one watcher task per model
 
     Returns:
         List of dicts with 'model' and 'response' keys
     """
-    messages = [{"role": "user", "content": user_query}]
-    models = config.get_council_models()
+    # Every model gets the same messages, so encode them once for all requests
+    messages_json = jsonutil.dumps([{"role": "user", "content": user_query}])
+    if models is None:
+        models = config.get_council_models()
     results_dict = {}  # model -> response
     
     async def stream_with_callback(model: str) -> tuple:
-        """Stream a model and report progress. Checks for skip signal."""
+        """Stream a model and report progress. Cancelled if the model is skipped."""
         try:
             async def chunk_handler(chunk: str):
-                # Check if this model was skipped
-                if should_skip_model and should_skip_model(model):
-                    raise asyncio.CancelledError("Model skipped by user")
                 if on_chunk:
                     await on_chunk(model, chunk)
             
-            result = await stream_model(model, messages, chunk_handler)
+            async with _STAGE1_SEM:
+                result = await stream_model_prebuilt(model, messages_json, chunk_handler)
             if on_model_complete:
                 await on_model_complete(model, result is not None)
             return (model, result)
@@ -54,77 +138,117 @@ async def stage1_collect_responses_streaming(
                 await on_model_complete(model, False)
             return (model, None)
     
-    # Create tasks with model tracking
+    # Create every model's task before the first await, so all requests go out in the
+    # same loop iteration rather than trickling out one scheduling cycle apart
     model_tasks = {model: asyncio.create_task(stream_with_callback(model)) for model in models}
-    pending = set(model_tasks.values())
-    
-    # Wait for tasks, checking for force-continue signal
-    while pending:
-        # Check if we should force continue
-        if should_force_continue and should_force_continue():
-            # Cancel remaining tasks
-            for task in pending:
-                task.cancel()
-            break
-        
-        # Wait for any task to complete (with short timeout to check signals)
-        done, pending = await asyncio.wait(pending, timeout=0.5, return_when=asyncio.FIRST_COMPLETED)
-        
-        # Process completed tasks
-        for task in done:
-            try:
-                model, response = task.result()
+
+    skip_watchers = []
+    watch_task = None
+    try:
+        # Fast path: nothing can interrupt the stage, so just collect in completion order
+        if not skip_events and stop_event is None:
+            for next_done in asyncio.as_completed(model_tasks.values()):
+                model, response = await next_done
                 if response is not None:
                     results_dict[model] = response
-            except Exception:
-                pass
+            return _format_stage1_results(models, results_dict)
+
+        pending = set(model_tasks.values())
+        if control_event is not None:
+            # One shared event wakes the loop, which then checks which events were set
+            watch_task = asyncio.create_task(control_event.wait())
+        else:
+            # Skipping a model wakes only that model's task
+            if skip_events:
+                for model, task in model_tasks.items():
+                    if model in skip_events:
+                        skip_watchers.append(asyncio.create_task(_cancel_when_set(skip_events[model], task)))
+            watch_task = asyncio.create_task(stop_event.wait()) if stop_event else None
+    
+        # Wait for tasks until all are done or the force-continue signal fires
+        while pending:
+            wait_set = pending | {watch_task} if watch_task else pending
+            done, _ = await asyncio.wait(wait_set, return_when=asyncio.FIRST_COMPLETED)
+        
+            # Process completed tasks
+            for task in done:
+                if task is watch_task:
+                    continue
+                pending.discard(task)
+                try:
+                    model, response = task.result()
+                    if response is not None:
+                        results_dict[model] = response
+                except Exception:
+                    pass
 
-    # Wait briefly for cancelled tasks to clean up
-    if pending:
-        await asyncio.sleep(0.1)
-        for task in pending:
+            if not (watch_task and watch_task.done()):
+                continue
+
+            stopping = True
+            if control_event is not None:
+                control_event.clear()
+                if skip_events:
+                    for model, task in model_tasks.items():
+                        if model in skip_events and skip_events[model].is_set():
+                            task.cancel()
+                stopping = stop_event is not None and stop_event.is_set()
+                if not stopping:
+                    watch_task = asyncio.create_task(control_event.wait())
+
+            if stopping:
+                # Cancel remaining tasks and let them unwind in the background -
+                # the caller has asked to move on with what it already has
+                for task in pending:
+                    task.cancel()
+                drain = asyncio.create_task(_drain_cancelled(pending))
+                _BACKGROUND_TASKS.add(drain)
+                drain.add_done_callback(_BACKGROUND_TASKS.discard)
+                break
+    finally:
+        # If the job itself is cancelled (e.g. its client disconnected), stop the
+        # streams too, instead of leaving them running up tokens for nobody
+        for task in model_tasks.values():
             if not task.done():
                 task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        if watch_task and not watch_task.done():
+            watch_task.cancel()
+        for watcher in skip_watchers:
+            watcher.cancel()
 
-    # Format results
-    stage1_results = []
-    for model in models:
-        if model in results_dict:
-            stage1_results.append({
-                "model": model,
-                "response": results_dict[model].get('content', '')
-            })
+    return _format_stage1_results(models, results_dict)
 
-    return stage1_results
+
+def _format_stage1_results(models: List[str], results_dict: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Format Stage 1 responses in council order."""
+    return [
+        {"model": model, "response": results_dict[model].get('content', '')}
+        for model in models
+        if model in results_dict
+    ]
 
 
 async def stage1_collect_responses(
     user_query: str,
-    on_model_complete: Optional[Callable[[str, bool], None]] = None
+    on_model_complete: Optional[Callable[[str, bool], None]] = None,
+    models: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Stage 1: Collect individual responses (non-streaming fallback).
     """
-    messages = [{"role": "user", "content": user_query}]
-    models = config.get_council_models()
+    # Every model gets the same messages, so encode them once for all requests
+    messages_json = jsonutil.dumps([{"role": "user", "content": user_query}])
+    if models is None:
+        models = config.get_council_models()
     
     async def query_with_callback(model: str) -> tuple:
         try:
-            result = await asyncio.wait_for(
-                query_model(model, messages, timeout=180.0),
-                timeout=190.0
-            )
+            # The request timeout is enforced by the HTTP client
+            async with _STAGE1_SEM:
+                result = await query_model_prebuilt(model, messages_json, timeout=180.0)
             if on_model_complete:
                 await on_model_complete(model, result is not None)
             return (model, result)
-        except asyncio.TimeoutError:
-            if on_model_complete:
-                await on_model_complete(model, False)
-            return (model, None)
         except Exception:
             if on_model_complete:
                 await on_model_complete(model, False)
@@ -154,58 +278,29 @@ def _build_ranking_prompt(user_query: str, stage1_results: List[Dict[str, Any]])
     Returns:
         Tuple of (prompt string, label_to_model mapping)
     """
-    # Create anonymized labels for responses (Response A, Response B, etc.)
-    labels = [chr(65 + i) for i in range(len(stage1_results))]  # A, B, C, ...
-
-    # Create mapping from label to model name
-    label_to_model = {
-        f"Response {label}": result['model']
-        for label, result in zip(labels, stage1_results)
-    }
-
-    # Build the ranking prompt
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
-        for label, result in zip(labels, stage1_results)
-    ])
-
-    ranking_prompt = f"""You are evaluating different responses to the following question:
-
-Question: {user_query}
-
-Here are the responses from different models (anonymized):
-
-{responses_text}
-
-Your task:
-1. First, evaluate each response individually. For each response, explain what it does well and what it does poorly.
-2. Then, at the very end of your response, provide a final ranking.
-
-IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
-- Start with the line "FINAL RANKING:" (all caps, with colon)
-- Then list the responses from best to worst as a numbered list
-- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
-- Do not add any other text or explanations in the ranking section
-
-Example of the correct format for your ENTIRE response:
-
-Response A provides good detail on X but misses Y...
-Response B is accurate but lacks depth on Z...
-Response C offers the most comprehensive answer...
-
-FINAL RANKING:
-1. Response C
-2. Response A
-3. Response B
-
-Now provide your evaluation and ranking:"""
-
-    return ranking_prompt, label_to_model
+    # Map anonymized labels to model names and assemble the prompt in one pass;
+    # a single join means large responses are copied once
+    label_to_model = {}
+    buf = [_RANKING_PROMPT_HEAD, user_query, _RANKING_PROMPT_RESPONSES]
+    for i, result in enumerate(stage1_results):
+        # Councils past 26 models go beyond Z, as chr(65 + i) always did
+        label = _LABELS[i] if i < len(_LABELS) else f"Response {chr(65 + i)}"
+        label_to_model[label] = result['model']
+        if i:
+            buf.append("\n\n")
+        buf.append(label)
+        buf.append(":\n")
+        buf.append(result['response'])
+    buf.append(_RANKING_PROMPT_TAIL)
+
+    return "".join(buf), label_to_model
 
 
 async def stage2_collect_rankings(
     user_query: str,
-    stage1_results: List[Dict[str, Any]]
+    stage1_results: List[Dict[str, Any]],
+    models: Optional[List[str]] = None,
+    on_ranking: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
     """
     Stage 2: Each model ranks the anonymized responses (non-streaming).
@@ -213,27 +308,37 @@ async def stage2_collect_rankings(
     Args:
         user_query: The original user query
         stage1_results: Results from Stage 1
+        models: Council models to query (defaults to the configured council)
+        on_ranking: Optional callback(ranking_result) called as each ranking completes
 
     Returns:
         Tuple of (rankings list, label_to_model mapping)
     """
     ranking_prompt, label_to_model = _build_ranking_prompt(user_query, stage1_results)
     messages = [{"role": "user", "content": ranking_prompt}]
+    if models is None:
+        models = config.get_council_models()
+
+    # Format each ranking as soon as its model finishes
+    rankings = {}  # model -> ranking result
+
+    def handle_response(model: str, response: Optional[Dict[str, Any]]):
+        if response is None:
+            return
+        full_text = response.get('content', '')
+        rankings[model] = {
+            "model": model,
+            "ranking": full_text,
+            "parsed_ranking": parse_ranking_from_text(full_text)
+        }
+        if on_ranking:
+            on_ranking(rankings[model])
 
     # Get rankings from all council models in parallel
-    responses = await query_models_parallel(config.get_council_models(), messages)
+    await query_models_parallel(models, messages, semaphore=_STAGE2_SEM, on_result=handle_response)
 
-    # Format results
-    stage2_results = []
-    for model, response in responses.items():
-        if response is not None:
-            full_text = response.get('content', '')
-            parsed = parse_ranking_from_text(full_text)
-            stage2_results.append({
-                "model": model,
-                "ranking": full_text,
-                "parsed_ranking": parsed
-            })
+    # Keep results in council order
+    stage2_results = [rankings[model] for model in models if model in rankings]
 
     return stage2_results, label_to_model
 
@@ -243,6 +348,7 @@ async def stage2_collect_rankings_streaming(
     stage1_results: List[Dict[str, Any]],
     on_chunk: Optional[Callable[[str, str], None]] = None,  # (model, chunk)
     on_model_complete: Optional[Callable[[str, bool], None]] = None,
+    models: Optional[List[str]] = None,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
     """
     Stage 2: Each model ranks the anonymized responses with streaming.
@@ -252,13 +358,16 @@ async def stage2_collect_rankings_streaming(
         stage1_results: Results from Stage 1
         on_chunk: Optional callback(model_name, text_chunk) called for each chunk
         on_model_complete: Optional callback(model_name, success) called when each model finishes
+        models: Council models to query (defaults to the configured council)
 
     Returns:
         Tuple of (rankings list, label_to_model mapping)
     """
     ranking_prompt, label_to_model = _build_ranking_prompt(user_query, stage1_results)
-    messages = [{"role": "user", "content": ranking_prompt}]
-    models = config.get_council_models()
+    # Every model gets the same prompt, so encode it once for all requests
+    messages_json = jsonutil.dumps([{"role": "user", "content": ranking_prompt}])
+    if models is None:
+        models = config.get_council_models()
     results_dict = {}  # model -> response content
     
     async def stream_with_callback(model: str) -> tuple:
@@ -268,7 +377,8 @@ async def stage2_collect_rankings_streaming(
                 if on_chunk:
                     await on_chunk(model, chunk)
             
-            result = await stream_model(model, messages, chunk_handler)
+            async with _STAGE2_SEM:
+                result = await stream_model_prebuilt(model, messages_json, chunk_handler)
             if on_model_complete:
                 await on_model_complete(model, result is not None)
             return (model, result)
@@ -304,69 +414,109 @@ async def stage2_collect_rankings_streaming(
     return stage2_results, label_to_model
 
 
-def _build_chairman_prompt(
-    user_query: str,
-    stage1_results: List[Dict[str, Any]],
-    stage2_results: List[Dict[str, Any]]
-) -> str:
+def _build_chairman_prefix(user_query: str, stage1_results: List[Dict[str, Any]]) -> str:
     """
-    Build the chairman prompt for Stage 3.
-    
+    Build the part of the multi-response chairman prompt that precedes the rankings.
+    It is known once Stage 1 is done, so it can be sent ahead for prompt caching.
+
     Returns:
-        The prompt string
+        The prompt prefix string
     """
-    # Build comprehensive context for chairman
-    stage1_text = "\n\n".join([
-        f"Model: {result['model']}\nResponse: {result['response']}"
-        for result in stage1_results
-    ])
+    buf = [_CHAIRMAN_MULTI_HEAD, user_query, _CHAIRMAN_MULTI_RESPONSES]
+    for i, result in enumerate(stage1_results):
+        if i:
+            buf.append("\n\n")
+        buf.append("Model: ")
+        buf.append(result['model'])
+        buf.append("\nResponse: ")
+        buf.append(result['response'])
+    return "".join(buf)
 
-    # Handle single response case - no peer rankings available
-    if len(stage1_results) == 1:
-        chairman_prompt = f"""You are the Chairman of an LLM Council. A single model has provided a response to the user's question.
 
-Original Question: {user_query}
+def _cached_text_part(text: str) -> Dict[str, Any]:
+    """A text content part marked as a prompt caching breakpoint."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
 
-COUNCIL MEMBER RESPONSE:
-{stage1_text}
 
-Your task as Chairman is to review this response and provide a refined, comprehensive answer. Consider:
-- The strengths and weaknesses of the provided response
-- Any gaps or areas that could be improved
-- Providing additional context or clarification where helpful
+def _build_chairman_messages(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Build the Stage 3 messages. With STAGE3_PROMPT_PREWARM the prompt is split
+    at the rankings so its prefix matches the one cached by stage3_prewarm.
 
-Provide a clear, well-reasoned final answer:"""
-    else:
-        # Multiple responses - include peer rankings
-        stage2_text = "\n\n".join([
-            f"Model: {result['model']}\nRanking: {result['ranking']}"
-            for result in stage2_results
-        ])
+    Returns:
+        The messages list
+    """
+    if config.STAGE3_PROMPT_PREWARM and len(stage1_results) > 1:
+        prefix = _build_chairman_prefix(user_query, stage1_results)
+        prompt = _build_chairman_prompt(user_query, stage1_results, stage2_results)
+        content = [_cached_text_part(prefix), {"type": "text", "text": prompt[len(prefix):]}]
+        return [{"role": "user", "content": content}]
+    return [{"role": "user", "content": _build_chairman_prompt(user_query, stage1_results, stage2_results)}]
 
-        chairman_prompt = f"""You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question, and then ranked each other's responses.
 
-Original Question: {user_query}
+async def stage3_prewarm(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    chairman_model: Optional[str] = None,
+):
+    """
+    Send the chairman the Stage 1 part of its prompt with a one-token answer, so
+    providers with prompt caching have it cached by the time Stage 3 starts.
+    Meant to run in the background while Stage 2 is in progress.
 
-STAGE 1 - Individual Responses:
-{stage1_text}
+    Args:
+        user_query: The original user query
+        stage1_results: Individual model responses from Stage 1
+        chairman_model: Chairman model to use (defaults to the configured chairman)
+    """
+    prefix = _build_chairman_prefix(user_query, stage1_results)
+    messages = [{"role": "user", "content": [_cached_text_part(prefix)]}]
+    await query_model(chairman_model or config.get_chairman_model(), messages, max_tokens=1)
 
-STAGE 2 - Peer Rankings:
-{stage2_text}
 
-Your task as Chairman is to synthesize all of this information into a single, comprehensive, accurate answer to the user's original question. Consider:
-- The individual responses and their insights
-- The peer rankings and what they reveal about response quality
-- Any patterns of agreement or disagreement
+def _build_chairman_prompt(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]]
+) -> str:
+    """
+    Build the chairman prompt for Stage 3.
+    
+    Returns:
+        The prompt string
+    """
+    # Single response case - no peer rankings available
+    if len(stage1_results) == 1:
+        result = stage1_results[0]
+        return "".join([
+            _CHAIRMAN_SINGLE_HEAD, user_query, _CHAIRMAN_SINGLE_RESPONSES,
+            "Model: ", result['model'], "\nResponse: ", result['response'],
+            _CHAIRMAN_SINGLE_TAIL,
+        ])
 
-Provide a clear, well-reasoned final answer that represents the council's collective wisdom:"""
+    # Multiple responses - include peer rankings
+    buf = [_build_chairman_prefix(user_query, stage1_results), _CHAIRMAN_MULTI_RANKINGS]
+    for i, result in enumerate(stage2_results):
+        if i:
+            buf.append("\n\n")
+        buf.append("Model: ")
+        buf.append(result['model'])
+        buf.append("\nRanking: ")
+        buf.append(result['ranking'])
+    buf.append(_CHAIRMAN_MULTI_TAIL)
 
-    return chairman_prompt
+    return "".join(buf)
 
 
 async def stage3_synthesize_final(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
-    stage2_results: List[Dict[str, Any]]
+    stage2_results: List[Dict[str, Any]],
+    chairman_model: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Stage 3: Chairman synthesizes final response (non-streaming).
@@ -375,15 +525,15 @@ async def stage3_synthesize_final(
         user_query: The original user query
         stage1_results: Individual model responses from Stage 1
         stage2_results: Rankings from Stage 2 (may be empty if only 1 response)
+        chairman_model: Chairman model to use (defaults to the configured chairman)
 
     Returns:
         Dict with 'model' and 'response' keys
     """
-    chairman_prompt = _build_chairman_prompt(user_query, stage1_results, stage2_results)
-    messages = [{"role": "user", "content": chairman_prompt}]
+    messages = _build_chairman_messages(user_query, stage1_results, stage2_results)
 
     # Query the chairman model
-    chairman = config.get_chairman_model()
+    chairman = chairman_model or config.get_chairman_model()
     response = await query_model(chairman, messages)
 
     if response is None:
@@ -405,6 +555,7 @@ async def stage3_synthesize_final_streaming(
     stage2_results: List[Dict[str, Any]],
     on_chunk: Optional[Callable[[str], None]] = None,  # (chunk)
     on_complete: Optional[Callable[[bool], None]] = None,
+    chairman_model: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Stage 3: Chairman synthesizes final response with streaming.
@@ -415,15 +566,15 @@ async def stage3_synthesize_final_streaming(
         stage2_results: Rankings from Stage 2 (may be empty if only 1 response)
         on_chunk: Optional callback(text_chunk) called for each chunk
         on_complete: Optional callback(success) called when complete
+        chairman_model: Chairman model to use (defaults to the configured chairman)
 
     Returns:
         Dict with 'model' and 'response' keys
     """
-    chairman_prompt = _build_chairman_prompt(user_query, stage1_results, stage2_results)
-    messages = [{"role": "user", "content": chairman_prompt}]
+    messages = _build_chairman_messages(user_query, stage1_results, stage2_results)
 
     # Query the chairman model with streaming
-    chairman = config.get_chairman_model()
+    chairman = chairman_model or config.get_chairman_model()
     
     try:
         async def chunk_handler(chunk: str):
@@ -464,28 +615,20 @@ def parse_ranking_from_text(ranking_text: str) -> List[str]:
     Returns:
         List of response labels in ranked order
     """
-    import re
-
-    # Look for "FINAL RANKING:" section
-    if "FINAL RANKING:" in ranking_text:
-        # Extract everything after "FINAL RANKING:"
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[1]
-            # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r'\d+\.\s*Response [A-Z]', ranking_section)
-            if numbered_matches:
-                # Extract just the "Response X" part
-                return [re.search(r'Response [A-Z]', m).group() for m in numbered_matches]
-
-            # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r'Response [A-Z]', ranking_section)
-            return matches
+    # Look for "FINAL RANKING:" section and take everything after it
+    _, sep, ranking_section = ranking_text.partition("FINAL RANKING:")
+    if sep:
+        # Try to extract numbered list format (e.g., "1. Response A");
+        # the group captures just the "Response X" part
+        numbered_matches = _NUMBERED_RE.findall(ranking_section)
+        if numbered_matches:
+            return numbered_matches
+
+        # Fallback: Extract all "Response X" patterns in order
+        return _RESPONSE_RE.findall(ranking_section)
 
     # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r'Response [A-Z]', ranking_text)
-    return matches
+    return _RESPONSE_RE.findall(ranking_text)
 
 
 def calculate_aggregate_rankings(
@@ -502,32 +645,29 @@ def calculate_aggregate_rankings(
     Returns:
         List of dicts with model name and average rank, sorted best to worst
     """
-    from collections import defaultdict
-
-    # Track positions for each model
-    model_positions = defaultdict(list)
+    # Track position sums and counts for each model
+    sums: Dict[str, int] = {}
+    counts: Dict[str, int] = {}
 
     for ranking in stage2_results:
-        ranking_text = ranking['ranking']
-
-        # Parse the ranking from the structured format
-        parsed_ranking = parse_ranking_from_text(ranking_text)
+        # Reuse the ranking parsed in Stage 2 when available
+        parsed_ranking = ranking.get('parsed_ranking') or parse_ranking_from_text(ranking['ranking'])
 
         for position, label in enumerate(parsed_ranking, start=1):
-            if label in label_to_model:
-                model_name = label_to_model[label]
-                model_positions[model_name].append(position)
+            model_name = label_to_model.get(label)
+            if model_name is not None:
+                sums[model_name] = sums.get(model_name, 0) + position
+                counts[model_name] = counts.get(model_name, 0) + 1
 
     # Calculate average position for each model
-    aggregate = []
-    for model, positions in model_positions.items():
-        if positions:
-            avg_rank = sum(positions) / len(positions)
-            aggregate.append({
-                "model": model,
-                "average_rank": round(avg_rank, 2),
-                "rankings_count": len(positions)
-            })
+    aggregate = [
+        {
+            "model": model,
+            "average_rank": round(sums[model] / counts[model], 2),
+            "rankings_count": counts[model]
+        }
+        for model in sums
+    ]
 
     # Sort by average rank (lower is better)
     aggregate.sort(key=lambda x: x['average_rank'])
@@ -583,8 +723,12 @@ async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
     Returns:
         Tuple of (stage1_results, stage2_results, stage3_result, metadata)
     """
+    # Resolve the council once so every stage uses the same configuration
+    models = config.get_council_models()
+    chairman = config.get_chairman_model()
+
     # Stage 1: Collect individual responses
-    stage1_results = await stage1_collect_responses(user_query)
+    stage1_results = await stage1_collect_responses(user_query, models=models)
 
     # If no models responded successfully, return error
     if not stage1_results:
@@ -593,19 +737,56 @@ async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
             "response": "All models failed to respond. Please try again."
         }, {}
 
-    # Stage 2: Collect rankings
-    stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results)
-
-    # Calculate aggregate rankings
-    aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-
-    # Stage 3: Synthesize final answer
+    # A single response has nothing to rank - go straight to the chairman
+    if len(stage1_results) < 2:
+        stage3_result = await stage3_synthesize_final(
+            user_query,
+            stage1_results,
+            [],
+            chairman_model=chairman
+        )
+        metadata = {
+            "label_to_model": {},
+            "aggregate_rankings": [],
+            "skipped_reason": "insufficient_responses_for_ranking"
+        }
+        return stage1_results, [], stage3_result, metadata
+
+    # Stage 2: Collect rankings. With three or more models the chairman starts once
+    # all but one have ranked, so a single slow ranker does not hold up Stage 3;
+    # smaller councils wait for every ranking, since one of two isn't a majority.
+    quorum = len(models) - 1 if len(models) >= 3 else len(models)
+    early_rankings = []
+    quorum_reached = asyncio.Event()
+
+    def on_ranking(result: Dict[str, Any]):
+        early_rankings.append(result)
+        if len(early_rankings) >= quorum:
+            quorum_reached.set()
+
+    stage2_task = asyncio.create_task(stage2_collect_rankings(
+        user_query, stage1_results, models=models, on_ranking=on_ranking
+    ))
+    quorum_task = asyncio.create_task(quorum_reached.wait())
+    await asyncio.wait({stage2_task, quorum_task}, return_when=asyncio.FIRST_COMPLETED)
+    quorum_task.cancel()
+
+    # Stage 3: Synthesize final answer from the rankings available so far, in council
+    # order so the chairman's prompt doesn't depend on which ranker finished first
+    council_order = {model: i for i, model in enumerate(models)}
     stage3_result = await stage3_synthesize_final(
         user_query,
         stage1_results,
-        stage2_results
+        sorted(early_rankings, key=lambda ranking: council_order.get(ranking['model'], len(models))),
+        chairman_model=chairman
     )
 
+    # Stragglers are still reported and counted in the aggregate
+    stage2_results, label_to_model = await stage2_task
+
+    # Calculate aggregate rankings
+    aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
+
     # Prepare metadata
     metadata = {
         "label_to_model": label_to_model,
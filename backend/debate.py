@@ -1,8 +1,13 @@
 """Live debate system where LLMs discuss and respond to each other in real-time."""
 
-from typing import List, Dict, Any, AsyncGenerator, Optional
+from typing import List, Dict, Any, AsyncGenerator, Optional, Tuple
+import asyncio
+from collections import deque
+import functools
 import json
-from .openrouter import query_model
+import re
+from types import MappingProxyType
+from .openrouter import query_model, stream_model
 from . import config
 
 # Predefined adversarial roles to prevent echo chambers
@@ -39,9 +44,151 @@ DEBATE_ROLES = {
     }
 }
 
+# Roles are shared by every debate, so expose them read-only
+DEBATE_ROLES = MappingProxyType({key: MappingProxyType(role) for key, role in DEBATE_ROLES.items()})
+
 # Default role rotation for debates
 DEFAULT_ROLE_ROTATION = ["advocate", "skeptic", "devils_advocate", "synthesizer"]
 
+# Condense turns that fell out of the history window once this many pile up
+HISTORY_CONDENSE_BATCH = 3
+
+# Moderator decision parsing
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+_PY_LITERAL_RE = re.compile(r'\b(True|False|None)\b')
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CONTINUE_RE = re.compile(r'"continue"\s*:\s*(true|false)', re.IGNORECASE)
+_NEXT_SPEAKER_RE = re.compile(r'"next_speaker"\s*:\s*(?:"((?:[^"\\]|\\.)*)"|null)')
+
+
+@functools.lru_cache(maxsize=256)
+def _derive_model_name(model_id: str) -> str:
+    """Derive a readable participant name from a model ID (e.g. 'openai/gpt-4o' -> 'Gpt')."""
+    return model_id.split('/')[-1].split('-')[0].title()
+
+
+async def _condense_history(moderator: str, topic: str, prefix_summary: str, entries: List[str]) -> Optional[str]:
+    """
+    Ask the moderator to fold older debate turns into the running summary.
+
+    Args:
+        moderator: Model used for condensing
+        topic: The debate topic
+        prefix_summary: Summary of turns condensed so far ("" if none)
+        entries: Formatted turns to fold in, oldest first
+
+    Returns:
+        The updated summary, or None if the request failed
+    """
+    earlier = f"Summary so far:\n{prefix_summary}\n\n" if prefix_summary else ""
+    turns = "\n\n".join(entries)
+    prompt = f"""You are keeping notes for a panel discussion on: {topic}
+
+{earlier}New turns to add:
+{turns}
+
+Write an updated summary of the discussion so far in one or two short paragraphs.
+Keep track of who argued what, and of any open questions or disagreements."""
+
+    try:
+        response = await query_model(moderator, [{"role": "user", "content": prompt}])
+    except Exception:
+        return None
+    return response.get('content') if response else None
+
+
+def _parse_moderator_decision(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the moderator's JSON decision from free-form model output.
+    Tolerates markdown fences, surrounding prose, nested braces, trailing
+    commas, single quotes, Python literals and truncated output.
+
+    Returns:
+        The decision dict, or None if nothing usable was found
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    # Find the matching closing brace, ignoring braces inside strings
+    depth = 0
+    in_string = False
+    escaped = False
+    end = None
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                end = i + 1
+                break
+
+    if end is not None:
+        candidate = text[start:end]
+    else:
+        # Truncated output - close whatever is still open
+        candidate = text[start:] + ('"' if in_string else '') + '}' * depth
+    candidate = _TRAILING_COMMA_RE.sub(r'\1', candidate)
+
+    lenient = _PY_LITERAL_RE.sub(lambda m: _PY_LITERALS[m.group()], candidate.replace("'", '"'))
+    for attempt in (candidate, lenient):
+        try:
+            decision = json.loads(attempt)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(decision, dict):
+            return decision
+    return None
+
+
+def _take_queued(first: str, chunks: asyncio.Queue) -> Tuple[str, bool]:
+    """
+    Join a streamed chunk with the chunks already queued behind it.
+
+    Args:
+        first: The chunk just taken from the queue
+        chunks: Queue of text chunks, ending with None
+
+    Returns:
+        Tuple of (joined text, whether the stream's end was reached)
+    """
+    parts = [first]
+    while not chunks.empty():
+        part = chunks.get_nowait()
+        if part is None:
+            return "".join(parts), True
+        parts.append(part)
+    return "".join(parts), False
+
+
+def _scan_decision_keys(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Check partially streamed moderator output for the keys needed to act.
+
+    Returns:
+        {"continue", "next_speaker"} once they are known, otherwise None
+    """
+    cont = _CONTINUE_RE.search(text)
+    if cont is None:
+        return None
+    if cont.group(1).lower() == 'false':
+        return {"continue": False, "next_speaker": None}
+    speaker = _NEXT_SPEAKER_RE.search(text)
+    if speaker is None:
+        return None
+    return {"continue": True, "next_speaker": speaker.group(1)}
+
 
 async def run_debate(
     topic: str,
@@ -81,16 +228,51 @@ async def run_debate(
             elif att['type'] == 'image':
                 context += f"\n\n[Image: {att['name']}]"
     
-    # Initialize debate history
+    # Initialize debate history. full_history_text renders all of it for the
+    # final summary and is extended once per entry instead of re-joined.
+    # history_text is what per-turn prompts see: a running summary of older
+    # turns, turns still waiting to be condensed, then the most recent turns.
     debate_history: List[Dict[str, str]] = []
+    full_history_text = ""
+    history_text = ""
+    window = config.DEBATE_HISTORY_WINDOW
+    recent_history = deque(maxlen=window if window > 0 else None)
+    uncondensed: List[str] = []
+    prefix_summary = ""
+    condense_task: Optional[asyncio.Task] = None
+    condense_count = 0  # Entries of `uncondensed` the running condense_task covers
+
+    def render_history() -> str:
+        parts = [f"**Earlier discussion (summary)**: {prefix_summary}"] if prefix_summary else []
+        parts.extend(uncondensed)
+        parts.extend(recent_history)
+        return "\n\n".join(parts)
+
+    def add_to_history(model_id: str, content: str, turn_type: str):
+        nonlocal full_history_text, history_text
+        debate_history.append({
+            "speaker": model_names[model_id],
+            "model": model_id,
+            "content": content,
+            "type": turn_type
+        })
+        entry = f"**{model_names[model_id]}**: {content}"
+        full_history_text = f"{full_history_text}\n\n{entry}" if full_history_text else entry
+        if len(recent_history) == recent_history.maxlen:
+            uncondensed.append(recent_history[0])
+        recent_history.append(entry)
+        history_text = render_history() if uncondensed or prefix_summary else full_history_text
     
     # Assign friendly names and optional roles to models
     model_names = {}
     model_roles = {}  # Maps model_id to role dict
+    # Role reminders for the prompts, formatted once ("" for models without a role)
+    model_role_instructions_opening = {}
+    model_role_instructions_discussion = {}
     
     for i, model_id in enumerate(debate_models):
         # Extract readable name from model ID
-        name = model_id.split('/')[-1].split('-')[0].title()
+        name = _derive_model_name(model_id)
         if name in model_names.values():
             name = f"{name}_{i+1}"
         model_names[model_id] = name
@@ -104,6 +286,17 @@ async def run_debate(
                 model_roles[model_id] = None
         else:
             model_roles[model_id] = None
+        
+        role = model_roles[model_id]
+        if role:
+            model_role_instructions_opening[model_id] = f"""\n\nYOUR ASSIGNED ROLE: {role['name']}
+Role Description: {role['description']}
+Your debating style should be: {role['style']}
+
+IMPORTANT: Stay true to your assigned role throughout the debate. Your role is designed to ensure rigorous examination of the topic from multiple angles."""
+            model_role_instructions_discussion[model_id] = f"""\n\nRemember your role: {role['name']} - {role['description']}
+Your style: {role['style']}
+Stay true to your role while engaging with others."""
     
     # Yield debate start event with role information
     participants_info = []
@@ -125,16 +318,11 @@ async def run_debate(
     # Get opening statements from each participant
     yield {"type": "phase", "phase": "opening_statements"}
     
-    for model_id in debate_models:
-        role = model_roles.get(model_id)
-        role_instruction = ""
-        if role:
-            role_instruction = f"""\n\nYOUR ASSIGNED ROLE: {role['name']}
-Role Description: {role['description']}
-Your debating style should be: {role['style']}
+    # Openings don't depend on each other, so all participants speak at once
+    opening_sem = asyncio.Semaphore(config.COUNCIL_MAX_CONCURRENCY)
 
-IMPORTANT: Stay true to your assigned role throughout the debate. Your role is designed to ensure rigorous examination of the topic from multiple angles."""
-        
+    async def give_opening(model_id: str) -> tuple:
+        role_instruction = model_role_instructions_opening.get(model_id, "")
         opening_prompt = f"""You are participating in a panel discussion on the following topic:
 
 TOPIC: {topic}
@@ -144,40 +332,52 @@ You are {model_names[model_id]}. Give your opening perspective on this topic in
 Be thoughtful and present your view consistent with your role. Share your unique perspective.
 Speak naturally as if in a live discussion."""
 
-        yield {"type": "speaker_start", "model": model_id, "name": model_names[model_id]}
-        
-        response = await query_model(model_id, [{"role": "user", "content": opening_prompt}])
+        try:
+            async with opening_sem:
+                response = await query_model(model_id, [{"role": "user", "content": opening_prompt}])
+        except Exception:
+            response = None
         content = response.get('content', 'Unable to respond.') if response else 'Unable to respond.'
-        
-        debate_history.append({
-            "speaker": model_names[model_id],
-            "model": model_id,
-            "content": content,
-            "type": "opening"
-        })
-        
-        yield {
-            "type": "speaker_complete",
-            "model": model_id,
-            "name": model_names[model_id],
-            "content": content,
-            "turn_type": "opening"
-        }
+        return model_id, content
+
+    opening_tasks = {model_id: asyncio.create_task(give_opening(model_id)) for model_id in debate_models}
+    try:
+        for model_id in debate_models:
+            yield {"type": "speaker_start", "model": model_id, "name": model_names[model_id]}
+
+        # Report each opening as soon as it arrives
+        for next_done in asyncio.as_completed(opening_tasks.values()):
+            model_id, content = await next_done
+            add_to_history(model_id, content, "opening")
+            
+            yield {
+                "type": "speaker_complete",
+                "model": model_id,
+                "name": model_names[model_id],
+                "content": content,
+                "turn_type": "opening"
+            }
+
+            # Keep the speaking indicator on a participant who is still going
+            still_speaking = next((m for m, t in opening_tasks.items() if not t.done()), None)
+            if still_speaking:
+                yield {"type": "speaker_start", "model": still_speaking, "name": model_names[still_speaking]}
+    finally:
+        # Stop outstanding openings if the client goes away mid-phase
+        for task in opening_tasks.values():
+            task.cancel()
     
     # Main debate loop - moderator selects speakers
     yield {"type": "phase", "phase": "discussion"}
+    batch_interval = config.STREAM_BATCH_MS / 1000
     
-    turn = 0
-    while turn < max_turns:
-        # Ask moderator who should speak next and if debate should continue
-        history_text = "\n\n".join([
-            f"**{h['speaker']}**: {h['content']}" for h in debate_history
-        ])
-        
-        moderator_prompt = f"""You are moderating a panel discussion on: {topic}
+    # Only the history changes between turns, so the prompts are built once as
+    # fixed head/tail pieces around it
+    moderator_prompt_head = f"""You are moderating a panel discussion on: {topic}
 
 Here is the discussion so far:
-{history_text}
+"""
+    moderator_prompt_tail = f"""
 
 Participants available to speak: {', '.join(model_names.values())}
 
@@ -189,55 +389,15 @@ Respond in this exact JSON format:
 {{"continue": true/false, "next_speaker": "speaker_name or null", "reason": "brief reason for your choice"}}
 
 If the discussion has covered the topic well, key points have been made, and continuing would be repetitive, set continue to false."""
-
-        mod_response = await query_model(moderator, [{"role": "user", "content": moderator_prompt}])
-        mod_content = mod_response.get('content', '') if mod_response else ''
-        
-        # Parse moderator decision
-        try:
-            # Extract JSON from response
-            import re
-            json_match = re.search(r'\{[^}]+\}', mod_content)
-            if json_match:
-                decision = json.loads(json_match.group())
-            else:
-                decision = {"continue": True, "next_speaker": list(model_names.values())[turn % len(model_names)]}
-        except:
-            decision = {"continue": True, "next_speaker": list(model_names.values())[turn % len(model_names)]}
-        
-        yield {
-            "type": "moderator_decision",
-            "decision": decision
-        }
-        
-        if not decision.get("continue", True):
-            break
-        
-        # Find the model ID for the selected speaker
-        next_speaker_name = decision.get("next_speaker")
-        next_model = None
-        for model_id, name in model_names.items():
-            if name.lower() == str(next_speaker_name).lower():
-                next_model = model_id
-                break
-        
-        if not next_model:
-            # Fallback to round-robin
-            next_model = debate_models[turn % len(debate_models)]
-        
-        # Get the next speaker's response
-        role = model_roles.get(next_model)
-        role_instruction = ""
-        if role:
-            role_instruction = f"""\n\nRemember your role: {role['name']} - {role['description']}
-Your style: {role['style']}
-Stay true to your role while engaging with others."""
-        
-        speaker_prompt = f"""You are {model_names[next_model]} in a panel discussion on: {topic}
+    speaker_prompt_heads = {
+        model_id: f"""You are {name} in a panel discussion on: {topic}
 {context}
 
 Here is the discussion so far:
-{history_text}{role_instruction}
+"""
+        for model_id, name in model_names.items()
+    }
+    speaker_prompt_tail = """
 
 The moderator has called on you to speak. Respond to what's been said - you can:
 - Build on someone's point
@@ -249,17 +409,149 @@ The moderator has called on you to speak. Respond to what's been said - you can:
 Be conversational and natural. Speak in 1-3 paragraphs. Don't repeat what's already been said.
 If you agree with someone, say so briefly and add something new. Have your own voice."""
 
-        yield {"type": "speaker_start", "model": next_model, "name": model_names[next_model]}
-        
-        response = await query_model(next_model, [{"role": "user", "content": speaker_prompt}])
+    turn = 0
+    while turn < max_turns:
+        # Pick up a finished condensation, and start one if enough old turns piled up
+        if condense_task is not None and condense_task.done():
+            condensed = condense_task.result()
+            condense_task = None
+            if condensed:
+                prefix_summary = condensed
+                del uncondensed[:condense_count]
+                history_text = render_history()
+        if condense_task is None and len(uncondensed) >= HISTORY_CONDENSE_BATCH:
+            condense_task = asyncio.create_task(
+                _condense_history(moderator, topic, prefix_summary, list(uncondensed))
+            )
+            condense_count = len(uncondensed)
+
+        # Ask moderator who should speak next and if debate should continue
+        moderator_prompt = moderator_prompt_head + history_text + moderator_prompt_tail
+
+        def resolve_speaker(decision: Dict[str, Any]) -> str:
+            """Find the model ID for the selected speaker, falling back to round-robin."""
+            next_speaker_name = str(decision.get("next_speaker")).lower()
+            for model_id, name in model_names.items():
+                if name.lower() == next_speaker_name:
+                    return model_id
+            return debate_models[turn % len(debate_models)]
+
+        def start_speaker(next_model: str) -> tuple:
+            """Build the speaker prompt and start streaming the model's reply.
+
+            Returns:
+                Tuple of (stream task, queue of text chunks ending with None)
+            """
+            role_instruction = model_role_instructions_discussion.get(next_model, "")
+            speaker_prompt = speaker_prompt_heads[next_model] + history_text + role_instruction + speaker_prompt_tail
+
+            chunk_queue: asyncio.Queue = asyncio.Queue()
+
+            async def on_chunk(chunk: str):
+                chunk_queue.put_nowait(chunk)
+
+            task = asyncio.create_task(
+                stream_model(next_model, [{"role": "user", "content": speaker_prompt}], on_chunk)
+            )
+            task.add_done_callback(lambda _: chunk_queue.put_nowait(None))
+            return task, chunk_queue
+
+        # Speculatively start the round-robin candidate (also the fallback pick)
+        # alongside the moderator; it is kept only if the moderator agrees
+        speculative = {}
+        if config.DEBATE_SPECULATIVE_PREFETCH:
+            predicted = debate_models[turn % len(debate_models)]
+            speculative[predicted] = start_speaker(predicted)
+
+        def take_speaker(model_id: str) -> tuple:
+            """Use the speculative call if it guessed right, otherwise start a fresh one."""
+            prefetched = speculative.pop(model_id, None)
+            for task, _ in speculative.values():
+                task.cancel()
+            speculative.clear()
+            return prefetched or start_speaker(model_id)
+
+        # Stream the moderator so the speaker can be called as soon as
+        # "continue" and "next_speaker" are known, while "reason" is still arriving
+        mod_chunks = []
+        early_decision = {}
+        decision_known = asyncio.Event()
+
+        async def on_mod_chunk(chunk: str):
+            mod_chunks.append(chunk)
+            if not decision_known.is_set():
+                keys = _scan_decision_keys("".join(mod_chunks))
+                if keys is not None:
+                    early_decision.update(keys)
+                    decision_known.set()
+
+        next_model = None
+        speaker_task = None
+        mod_task = None
+        try:
+            mod_task = asyncio.create_task(
+                stream_model(moderator, [{"role": "user", "content": moderator_prompt}], on_mod_chunk)
+            )
+            known_task = asyncio.create_task(decision_known.wait())
+            await asyncio.wait({mod_task, known_task}, return_when=asyncio.FIRST_COMPLETED)
+            known_task.cancel()
+
+            if early_decision.get("continue"):
+                next_model = resolve_speaker(early_decision)
+                speaker_task, speaker_chunks = take_speaker(next_model)
+
+            mod_response = await mod_task
+            mod_content = mod_response.get('content', '') if mod_response else ''
+
+            # Parse moderator decision
+            decision = _parse_moderator_decision(mod_content) or early_decision or {
+                "continue": True,
+                "next_speaker": list(model_names.values())[turn % len(model_names)]
+            }
+            
+            yield {
+                "type": "moderator_decision",
+                "decision": decision
+            }
+            
+            if not decision.get("continue", True):
+                break
+            
+            if speaker_task is None:
+                next_model = resolve_speaker(decision)
+                speaker_task, speaker_chunks = take_speaker(next_model)
+
+            # Relay the next speaker's response as it streams in
+            yield {"type": "speaker_start", "model": next_model, "name": model_names[next_model]}
+            
+            # Tokens that arrive within one batch window go out as a single event
+            ended = False
+            while not ended and (chunk := await speaker_chunks.get()) is not None:
+                await asyncio.sleep(batch_interval)
+                delta, ended = _take_queued(chunk, speaker_chunks)
+                yield {
+                    "type": "speaker_chunk",
+                    "model": next_model,
+                    "name": model_names[next_model],
+                    "delta": delta,
+                    "turn_type": "discussion"
+                }
+            response = await speaker_task
+        except (asyncio.CancelledError, GeneratorExit):
+            # The client went away; don't leave a condensation running
+            if condense_task is not None:
+                condense_task.cancel()
+            raise
+        finally:
+            if speaker_task is not None and not speaker_task.done():
+                speaker_task.cancel()
+            for task, _ in speculative.values():
+                task.cancel()
+            if mod_task is not None and not mod_task.done():
+                mod_task.cancel()
         content = response.get('content', 'Unable to respond.') if response else 'Unable to respond.'
         
-        debate_history.append({
-            "speaker": model_names[next_model],
-            "model": next_model,
-            "content": content,
-            "type": "discussion"
-        })
+        add_to_history(next_model, content, "discussion")
         
         yield {
             "type": "speaker_complete",
@@ -272,16 +564,10 @@ If you agree with someone, say so briefly and add something new. Have your own v
         turn += 1
     
     # Final summary from moderator
-    yield {"type": "phase", "phase": "conclusion"}
-    
-    final_history = "\n\n".join([
-        f"**{h['speaker']}**: {h['content']}" for h in debate_history
-    ])
-    
     summary_prompt = f"""You moderated a panel discussion on: {topic}
 
 Here is the full discussion:
-{final_history}
+{full_history_text}
 
 Provide a thoughtful summary that:
 1. Captures the key points and perspectives shared
@@ -291,9 +577,23 @@ Provide a thoughtful summary that:
 
 Be fair to all participants and their viewpoints."""
 
-    yield {"type": "summary_start"}
-    
-    summary_response = await query_model(moderator, [{"role": "user", "content": summary_prompt}])
+    # The discussion is over, so any pending condensation is moot
+    if condense_task is not None:
+        condense_task.cancel()
+
+    # full_history_text is already complete, so request the summary before
+    # announcing the phase; the round-trip overlaps with event delivery
+    summary_task = asyncio.create_task(
+        query_model(moderator, [{"role": "user", "content": summary_prompt}])
+    )
+    try:
+        yield {"type": "phase", "phase": "conclusion"}
+        yield {"type": "summary_start"}
+        
+        summary_response = await summary_task
+    finally:
+        if not summary_task.done():
+            summary_task.cancel()
     summary = summary_response.get('content', 'Unable to generate summary.') if summary_response else 'Unable to generate summary.'
     
     yield {
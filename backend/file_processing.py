@@ -1,12 +1,25 @@
 """File processing utilities for PDFs and images."""
 
+import asyncio
 import base64
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from PIL import Image
 import io
 
+# pybase64 is a SIMD-accelerated drop-in for base64 encoding
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
+# pypdfium2 extracts text in native code (PDFium); PyPDF2 is the pure-Python fallback
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 try:
     from PyPDF2 import PdfReader
 except ImportError:
@@ -20,34 +33,66 @@ def ensure_uploads_dir():
     Path(UPLOADS_DIR).mkdir(parents=True, exist_ok=True)
 
 
-def extract_text_from_pdf(file_path: str) -> Optional[str]:
+def iter_pdf_pages(file_path: str) -> Iterator[Tuple[int, str]]:
     """
-    Extract text content from a PDF file.
+    Yield (page_num, text) for each PDF page that has text, one page at a time.
+    Raises if the PDF can't be read; requires pypdfium2 or PyPDF2.
     
     Args:
         file_path: Path to the PDF file
-        
-    Returns:
-        Extracted text or None if extraction fails
     """
-    if PdfReader is None:
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            for index in range(len(pdf)):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                try:
+                    text = textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+                if text and text.strip():
+                    yield index + 1, text
+        finally:
+            pdf.close()
+        return
+
+    reader = PdfReader(file_path)
+    for page_num, page in enumerate(reader.pages, 1):
+        text = page.extract_text()
+        if text and text.strip():
+            yield page_num, text
+
+
+def _extract_pdf_sections(file_path: str) -> Optional[List[str]]:
+    """Extract one "--- Page N ---" section per page with text, or None if extraction fails."""
+    if pdfium is None and PdfReader is None:
         return None
         
     try:
-        reader = PdfReader(file_path)
-        text_parts = []
-        
-        for page_num, page in enumerate(reader.pages, 1):
-            text = page.extract_text()
-            if text.strip():
-                text_parts.append(f"--- Page {page_num} ---\n{text}")
-        
-        return "\n\n".join(text_parts)
+        return [f"--- Page {page_num} ---\n{text}" for page_num, text in iter_pdf_pages(file_path)]
     except Exception as e:
         print(f"Error extracting text from PDF: {e}")
         return None
 
 
+def extract_text_from_pdf(file_path: str) -> Optional[str]:
+    """
+    Extract text content from a PDF file.
+    
+    Args:
+        file_path: Path to the PDF file
+        
+    Returns:
+        Extracted text or None if extraction fails
+    """
+    sections = _extract_pdf_sections(file_path)
+    if sections is None:
+        return None
+    return "\n\n".join(sections)
+
+
 def encode_image_to_base64(file_path: str, max_size: tuple = (1024, 1024)) -> Optional[Dict[str, Any]]:
     """
     Encode an image to base64 and resize if needed.
@@ -61,6 +106,11 @@ def encode_image_to_base64(file_path: str, max_size: tuple = (1024, 1024)) -> Op
     """
     try:
         with Image.open(file_path) as img:
+            # Let libjpeg decode straight to a reduced size instead of
+            # materializing the full-resolution raster first
+            if img.format == 'JPEG':
+                img.draft('RGB', max_size)
+            
             # Convert to RGB if necessary (handles RGBA, P, etc.)
             if img.mode not in ('RGB', 'L'):
                 img = img.convert('RGB')
@@ -71,11 +121,12 @@ def encode_image_to_base64(file_path: str, max_size: tuple = (1024, 1024)) -> Op
             
             # Save to bytes
             buffer = io.BytesIO()
-            img.save(buffer, format='JPEG', quality=85)
-            buffer.seek(0)
+            # Single-pass baseline encode; Huffman optimization isn't worth the CPU for transport
+            img.save(buffer, format='JPEG', quality=85, optimize=False, progressive=False, subsampling=2)
             
-            # Encode to base64
-            base64_data = base64.b64encode(buffer.read()).decode('utf-8')
+            # Encode straight from the buffer's memory (no intermediate bytes copy);
+            # base64 output is pure ASCII
+            base64_data = _b64.b64encode(buffer.getbuffer()).decode('ascii')
             
             return {
                 'base64': base64_data,
@@ -120,14 +171,14 @@ def process_uploaded_file(file_path: str, file_type: str) -> Optional[Dict[str,
     file_info = get_file_info(file_path)
     
     if file_type == 'pdf':
-        text = extract_text_from_pdf(file_path)
-        if text:
+        sections = _extract_pdf_sections(file_path)
+        if sections:
             return {
                 'type': 'pdf',
                 'name': file_info['name'],
                 'size': file_info['size'],
-                'text_content': text,
-                'page_count': text.count('--- Page ')
+                'text_content': "\n\n".join(sections),
+                'page_count': len(sections)
             }
     elif file_type == 'image':
         image_data = encode_image_to_base64(file_path)
@@ -143,3 +194,11 @@ def process_uploaded_file(file_path: str, file_type: str) -> Optional[Dict[str,
             }
     
     return None
+
+
+async def process_uploaded_file_async(file_path: str, file_type: str) -> Optional[Dict[str, Any]]:
+    """
+    Process an uploaded file in a worker thread so PDF parsing and image
+    decoding don't block the event loop. See process_uploaded_file.
+    """
+    return await asyncio.to_thread(process_uploaded_file, file_path, file_type)
@@ -1,15 +1,189 @@
 """Job manager for tracking council processes that run independently of client connections."""
 
 import asyncio
-import json
+import heapq
 import os
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Iterable, Tuple
 from enum import Enum
 import uuid
+from . import jsonutil
 
-# Jobs are persisted to this file
-JOBS_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'jobs.json')
+# Jobs are persisted as a snapshot plus an append-only log of changes since it.
+# The snapshot is one file per job in JOBS_DIR, plus an index of the jobs held
+# in memory, the active conversation jobs and the log position.
+JOBS_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'jobs')
+JOBS_INDEX = os.path.join(JOBS_DIR, 'index.json')
+JOBS_LOG = os.path.join(os.path.dirname(__file__), '..', 'data', 'jobs.log')
+# Single-file snapshot used before per-job files; migrated on load
+LEGACY_JOBS_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'jobs.json')
+
+# Finished jobs beyond this many (least recently used first) are dropped from
+# memory; their files in JOBS_DIR are read back on demand
+MAX_FINISHED_JOBS_IN_MEMORY = 100
+
+# Stream previews keep at most about this many of the latest characters; the
+# full responses are stored separately in the stage results
+MAX_STREAM_CHARS = 256 * 1024
+
+# Bursts of job updates within this window are coalesced into a single write
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+# Rewrite the snapshot (and truncate the log) once this many log entries pile up,
+# or once the log grows past this many bytes
+JOBS_LOG_COMPACT_ENTRIES = 500
+JOBS_LOG_COMPACT_BYTES = 10 * 1024 * 1024
+
+# Serializes writers to the job files (the background flusher thread and shutdown flush)
+_WRITE_LOCK = threading.Lock()
+
+# Append handle for JOBS_LOG, kept open so each batch costs one write() rather
+# than open/write/close. Guarded by _WRITE_LOCK.
+_log_file = None
+
+
+def _append_jobs_log(data: bytes):
+    """Append log lines to JOBS_LOG. Safe to call from a worker thread."""
+    global _log_file
+    with _WRITE_LOCK:
+        if _log_file is None:
+            os.makedirs(os.path.dirname(JOBS_LOG), exist_ok=True)
+            _log_file = open(JOBS_LOG, 'ab')
+        _log_file.write(data)
+        _log_file.flush()
+
+
+def _close_jobs_log():
+    """Close the log append handle (on shutdown). Safe to call from a worker thread."""
+    global _log_file
+    with _WRITE_LOCK:
+        if _log_file is not None:
+            _log_file.close()
+            _log_file = None
+
+
+def _write_file_atomic(path: str, data: bytes):
+    """Write data to path via a synced temp file, so a crash leaves the old or new file."""
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+        # Make sure the new file is on disk before it replaces the old one
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+def _write_jobs_snapshot(job_files: Dict[str, bytes], index: bytes):
+    """
+    Write a snapshot (job files first, then the index) and truncate the log.
+    Safe to call from a worker thread.
+    """
+    with _WRITE_LOCK:
+        os.makedirs(JOBS_DIR, exist_ok=True)
+        for job_id, data in job_files.items():
+            _write_file_atomic(_job_file_path(job_id), data)
+        # Replaying the log is idempotent, so an index older than some job
+        # files (crash in between) still yields the right state
+        _write_file_atomic(JOBS_INDEX, index)
+        if os.path.exists(LEGACY_JOBS_FILE):
+            os.remove(LEGACY_JOBS_FILE)
+        # Entries up to the snapshot's log_seq are now redundant; replay skips them
+        # anyway, so a crash before this truncate is harmless. The append handle
+        # is O_APPEND, so it carries on from the new end of file.
+        if _log_file is not None:
+            _log_file.truncate(0)
+        else:
+            open(JOBS_LOG, 'wb').close()
+
+
+# (epoch seconds, ISO string) of the last formatted timestamp
+_iso_cache = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string, reformatted at most once per second."""
+    global _iso_cache
+    now = time.time()
+    if now - _iso_cache[0] >= 1.0:
+        _iso_cache = (now, datetime.utcfromtimestamp(now).isoformat())
+    return _iso_cache[1]
+
+
+def _created_ts(job: Dict[str, Any]) -> float:
+    """Get a job's creation time as a Unix timestamp."""
+    created_ts = job.get("created_ts")
+    if created_ts is None:
+        # Jobs persisted before created_ts existed (created_at is naive UTC)
+        created_ts = datetime.fromisoformat(job["created_at"]).replace(tzinfo=timezone.utc).timestamp()
+    return created_ts
+
+
+def _job_file_path(job_id: str) -> str:
+    """Get the path of a job's file."""
+    return os.path.join(JOBS_DIR, f"{job_id}.json")
+
+
+def _write_job_file(job_id: str, data: bytes):
+    """Atomically write a job's file. Safe to call from a worker thread."""
+    os.makedirs(JOBS_DIR, exist_ok=True)
+    _write_file_atomic(_job_file_path(job_id), data)
+
+
+def _is_job_id(job_id: str) -> bool:
+    """Check that job_id is a UUID (hex, or with dashes from older jobs) as jobs are named."""
+    try:
+        return uuid.UUID(job_id).hex == job_id.replace('-', '')
+    except ValueError:
+        return False
+
+
+def _read_job_file(job_id: str) -> Optional[bytes]:
+    """Read a job's file, or None if there is none. Safe to call from a worker thread."""
+    # Job IDs come from URLs; never let one name a path outside JOBS_DIR, or the index
+    if not _is_job_id(job_id):
+        return None
+    try:
+        with open(_job_file_path(job_id), 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _prune_job_files(cutoff: float, job_ids: Iterable[str] = (), keep: Iterable[str] = ()):
+    """
+    Delete the files of `job_ids`, plus those of spilled jobs last written before `cutoff`.
+    Safe to call from a worker thread.
+
+    Args:
+        cutoff: Unix time; older files of finished spilled jobs are deleted
+        job_ids: Jobs whose files are deleted regardless of age
+        keep: Jobs still held in memory (and listed in the index); their files are left alone
+    """
+    for job_id in job_ids:
+        try:
+            os.remove(_job_file_path(job_id))
+        except FileNotFoundError:
+            pass
+    if not os.path.isdir(JOBS_DIR):
+        return
+    keep = set(keep)
+    with os.scandir(JOBS_DIR) as entries:
+        for entry in entries:
+            job_id = entry.name[:-5]
+            if (not entry.name.endswith('.json') or not _is_job_id(job_id) or job_id in keep
+                    or entry.stat().st_mtime >= cutoff):
+                continue
+            # Only finished jobs are spilled, but check before deleting anything
+            data = _read_job_file(job_id)
+            try:
+                finished = data is not None and jsonutil.loads(data).get("status") in TERMINAL_STATUSES
+            except jsonutil.JSONDecodeError:
+                finished = False
+            if finished:
+                os.remove(entry.path)
 
 
 class JobStatus(str, Enum):
@@ -23,10 +197,51 @@ class JobStatus(str, Enum):
     ERROR = "error"
 
 
+# Statuses after which a job no longer runs
+TERMINAL_STATUSES = frozenset({JobStatus.COMPLETE, JobStatus.ERROR})
+# Statuses during which individual Stage 1 models can still be skipped
+_SKIPPABLE_STATUSES = frozenset({JobStatus.STAGE1_RUNNING, JobStatus.PENDING})
+# Stream statuses worth persisting; intermediate states are only kept in memory
+_STREAM_PERSIST_STATUSES = frozenset({"complete", "failed"})
+
+
+def _job_view(job: Dict[str, Any], live: Optional[Dict[str, Dict[str, List[str]]]] = None) -> Dict[str, Any]:
+    """
+    Copy a job for callers and persistence, without the task object.
+
+    Args:
+        job: The job dict
+        live: The job's in-memory stream buffers (stage -> model -> deque of chunks); when
+              given, content still streaming is joined into the copy
+
+    Returns:
+        A shallow copy of the job
+    """
+    view = {k: v for k, v in job.items() if k != "task"}
+    if live:
+        progress = view["progress"] = dict(job["progress"])
+        for stage, buffers in live.items():
+            if stage == "stage3_stream":
+                stream = progress[stage]
+                progress[stage] = {**stream, "content": stream["content"] + "".join(buffers[""])}
+                continue
+            streams = progress[stage] = dict(progress[stage])
+            for model, chunks in buffers.items():
+                stream = streams[model]
+                streams[model] = {**stream, "content": stream["content"] + "".join(chunks)}
+    return view
+
+
 class JobManager:
     """
     Manages council jobs that run independently of client connections.
     Jobs persist to disk so they survive server restarts.
+
+    Concurrency: everything runs on the event loop thread, so a method that
+    doesn't await can't observe a half-applied update. Reads therefore take
+    no lock at all (readers never wait on each other or on writers), while
+    mutations that await take the job's own lock, so updates to different
+    jobs don't contend.
     """
     
     def __init__(self):
@@ -34,48 +249,391 @@ class JobManager:
         self._jobs: Dict[str, Dict[str, Any]] = {}
         # conversation_id -> job_id (for active jobs only)
         self._conversation_jobs: Dict[str, str] = {}
-        # Lock for thread-safe operations
-        self._lock = asyncio.Lock()
-        # Models that should be skipped (job_id -> set of model names)
-        self._skipped_models: Dict[str, set] = {}
-        # Flag to force continue to stage 2 (job_id -> bool)
-        self._force_continue: Dict[str, bool] = {}
+        # Lock for changes to job membership (adding/removing jobs)
+        self._index_lock = asyncio.Lock()
+        # Per-job locks for mutations, so updates to different jobs don't contend
+        self._job_locks: Dict[str, asyncio.Lock] = {}
+        # Models that should be skipped (job_id -> frozenset of model names);
+        # replaced rather than mutated, so readers never see a set mid-update
+        self._skipped_models: Dict[str, frozenset] = {}
+        # Events that wake Stage 1 when a model is skipped (job_id -> model -> event)
+        self._skip_events: Dict[str, Dict[str, asyncio.Event]] = {}
+        # Events set to force continue to stage 2 (job_id -> event)
+        self._force_continue_events: Dict[str, asyncio.Event] = {}
+        # Events set alongside any skip or force-continue event, so Stage 1 can
+        # watch one event instead of one per model (job_id -> event)
+        self._control_events: Dict[str, asyncio.Event] = {}
+        # Chunks of streams still in progress, kept out of the persisted jobs
+        # (job_id -> stage -> model -> chunks; the Stage 3 stream uses model "")
+        self._live_streams: Dict[str, Dict[str, Dict[str, deque]]] = {}
+        # Set mirrors of the progress model lists for O(1) membership checks
+        # (job_id -> list name -> set); the lists stay the stored/API form
+        self._progress_sets: Dict[str, Dict[str, set]] = {}
+        # Finished jobs still in memory, least recently used first
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        # (created_ts, job_id) of finished jobs, oldest first, for TTL cleanup;
+        # entries for jobs already evicted or removed are skipped when popped
+        self._finished_heap: List[Tuple[float, str]] = []
+        # Cached reader views (job_id -> view), rebuilt on the first read after a change
+        self._views: Dict[str, Dict[str, Any]] = {}
+        # Per-job change counters, and the events that wake streams waiting on a change
+        self._versions: Dict[str, int] = {}
+        # Per-job counters of changes to progress alone, so streams can skip unchanged progress
+        self._progress_versions: Dict[str, int] = {}
+        self._change_events: Dict[str, asyncio.Event] = {}
+        # Encoded log lines not yet written, and the sequence number of the last one
+        self._pending_log: List[bytes] = []
+        self._log_seq = 0
+        # Jobs with logged changes since the last snapshot; only their files are rewritten
+        self._dirty_jobs: set = set()
+        # Log entries (and bytes) written since the last snapshot
+        self._log_entries = 0
+        self._log_bytes = 0
+        # Set when jobs have changed since the last write; drained by the flusher
+        self._dirty = asyncio.Event()
+        # Background task that writes dirty jobs to disk (started on first change)
+        self._flush_task: Optional[asyncio.Task] = None
+        # Keeps concurrent writes (flusher vs. immediate persists) in log order
+        self._save_lock = asyncio.Lock()
         # Load persisted jobs on startup
         self._load_jobs()
     
     def _load_jobs(self):
-        """Load jobs from disk on startup."""
+        """Load jobs from disk on startup: read the snapshot, then replay the log."""
         try:
-            if os.path.exists(JOBS_FILE):
-                with open(JOBS_FILE, 'r') as f:
-                    data = json.load(f)
+            snapshot_seq = 0
+            migrate = False
+            if os.path.exists(JOBS_INDEX):
+                with open(JOBS_INDEX, 'rb') as f:
+                    index = jsonutil.loads(f.read())
+                for job_id in index.get('jobs', []):
+                    data = _read_job_file(job_id)
+                    if data is None:
+                        print(f"[JobManager] Missing file for job {job_id}")
+                        continue
+                    self._jobs[job_id] = jsonutil.loads(data)
+                self._conversation_jobs = index.get('conversation_jobs', {})
+                snapshot_seq = index.get('log_seq', 0)
+            elif os.path.exists(LEGACY_JOBS_FILE):
+                with open(LEGACY_JOBS_FILE, 'rb') as f:
+                    data = jsonutil.loads(f.read())
                     self._jobs = data.get('jobs', {})
                     self._conversation_jobs = data.get('conversation_jobs', {})
-                    print(f"[JobManager] Loaded {len(self._jobs)} jobs from disk")
+                    snapshot_seq = data.get('log_seq', 0)
+                migrate = True
+                self._dirty_jobs.update(self._jobs)
+            self._log_seq = snapshot_seq
+
+            torn = False
+            if os.path.exists(JOBS_LOG):
+                with open(JOBS_LOG, 'rb') as f:
+                    for line in f:
+                        try:
+                            record = jsonutil.loads(line)
+                        except jsonutil.JSONDecodeError:
+                            # A torn final line from a crash mid-write
+                            torn = True
+                            continue
+                        if record.get('seq', 0) <= snapshot_seq:
+                            continue
+                        self._apply_log_record(record)
+                        if record.get('job_id'):
+                            self._dirty_jobs.add(record['job_id'])
+                        self._log_seq = record['seq']
+                        self._log_entries += 1
+                self._log_bytes = os.path.getsize(JOBS_LOG)
+
+            # Progress lists aren't logged; rebuild them from the stream statuses
+            for job in self._jobs.values():
+                self._derive_progress(job)
+
+            finished = [job for job in self._jobs.values() if job["status"] in TERMINAL_STATUSES]
+            finished.sort(key=_created_ts)
+            for job in finished:
+                self._finished[job["id"]] = None
+            self._finished_heap = [(_created_ts(job), job["id"]) for job in finished]
+
+            # Compact right away so new entries aren't appended onto a torn line
+            # (or to move a legacy snapshot to per-job files)
+            if torn or migrate:
+                self._save_jobs()
+
+            print(f"[JobManager] Loaded {len(self._jobs)} jobs from disk")
         except Exception as e:
             print(f"[JobManager] Failed to load jobs: {e}")
             self._jobs = {}
             self._conversation_jobs = {}
+
+    def _apply_log_record(self, record: Dict[str, Any]):
+        """Replay one job log record onto the in-memory state."""
+        op = record.get('op')
+        job_id = record.get('job_id')
+        if op == 'create':
+            self._jobs[job_id] = record['job']
+            self._conversation_jobs[record['job']['conversation_id']] = job_id
+        elif op == 'set':
+            target = self._jobs.get(job_id)
+            if target is None:
+                return
+            for key in record.get('path', []):
+                target = target.setdefault(key, {})
+            target.update(record['fields'])
+        elif op == 'conversation_end':
+            conversation_id = record['conversation_id']
+            if self._conversation_jobs.get(conversation_id) == job_id:
+                del self._conversation_jobs[conversation_id]
+        elif op == 'delete':
+            self._jobs.pop(job_id, None)
     
+    @staticmethod
+    def _derive_progress(job: Dict[str, Any]):
+        """Fill in a job's progress counters and model lists from its Stage 1 streams."""
+        progress = job.get("progress")
+        if not progress:
+            return
+        streams = progress.get("model_streams", {})
+        progress["models_total"] = max(progress.get("models_total", 0), len(streams))
+        for model, stream in streams.items():
+            status = stream.get("status")
+            if status == "complete":
+                target = progress["models_responded"]
+            elif status in ("failed", "skipped"):
+                target = progress["models_failed"]
+            else:
+                continue
+            if model not in target:
+                target.append(model)
+
+    def _serialize_jobs(self) -> Tuple[Dict[str, bytes], bytes]:
+        """
+        Serialize the snapshot to JSON bytes. Runs on the event loop thread because
+        the job dicts are mutated in place there; only the file writes are offloaded.
+
+        Returns:
+            Tuple of (job_id -> job file contents, index file contents)
+        """
+        # Jobs without logged changes still match their files on disk
+        job_files = {}
+        for job_id in self._dirty_jobs:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                # Don't save task objects - they can't be serialized
+                job_files[job_id] = jsonutil.dumps(_job_view(job))
+        self._dirty_jobs.clear()
+        
+        index = jsonutil.dumps({
+            'jobs': list(self._jobs),
+            'conversation_jobs': self._conversation_jobs,
+            'log_seq': self._log_seq
+        })
+        return job_files, index
+
+    def _log(self, record: Dict[str, Any]):
+        """
+        Queue a change record for the job log and schedule a flush.
+        The record is encoded immediately, capturing the values as they are now.
+        """
+        # A deleted job was already forgotten; tracking it here would bring its entries back
+        if 'job_id' in record and record.get('op') != 'delete':
+            path = record.get('path')
+            self._changed(record['job_id'], progress=bool(path) and path[0] == "progress")
+            self._dirty_jobs.add(record['job_id'])
+        self._log_seq += 1
+        record['seq'] = self._log_seq
+        self._pending_log.append(jsonutil.dumps(record) + b'\n')
+        self._mark_dirty()
+
+    def _log_set(self, job_id: str, fields: Dict[str, Any], path: Iterable[str] = ()):
+        """Log that `fields` were set on the job (or on the nested dict at `path`)."""
+        self._log({'op': 'set', 'job_id': job_id, 'path': list(path), 'fields': fields})
+
+    def _log_conversation_end(self, job_id: str, conversation_id: str):
+        """Log that the job is no longer the active job for its conversation."""
+        self._log({'op': 'conversation_end', 'job_id': job_id, 'conversation_id': conversation_id})
+
     def _save_jobs(self):
-        """Save jobs to disk."""
+        """Write a full snapshot synchronously (used while loading, before the loop runs)."""
         try:
-            # Ensure data directory exists
-            os.makedirs(os.path.dirname(JOBS_FILE), exist_ok=True)
-            
-            # Don't save task objects - they can't be serialized
-            jobs_to_save = {}
-            for job_id, job in self._jobs.items():
-                jobs_to_save[job_id] = {k: v for k, v in job.items() if k != 'task'}
-            
-            with open(JOBS_FILE, 'w') as f:
-                json.dump({
-                    'jobs': jobs_to_save,
-                    'conversation_jobs': self._conversation_jobs
-                }, f, indent=2)
+            self._pending_log.clear()
+            self._log_entries = 0
+            self._log_bytes = 0
+            job_files, index = self._serialize_jobs()
+            try:
+                _write_jobs_snapshot(job_files, index)
+            except Exception:
+                self._dirty_jobs.update(job_files)
+                self._log_entries = JOBS_LOG_COMPACT_ENTRIES
+                raise
         except Exception as e:
             print(f"[JobManager] Failed to save jobs: {e}")
+
+    async def _save_jobs_async(self):
+        """
+        Persist pending changes, doing the file I/O in a worker thread.
+        Usually appends the queued log lines; compacts into a snapshot once the log grows.
+        """
+        async with self._save_lock:
+            try:
+                data = b''.join(self._pending_log)
+                if (self._log_entries + len(self._pending_log) >= JOBS_LOG_COMPACT_ENTRIES
+                        or self._log_bytes + len(data) >= JOBS_LOG_COMPACT_BYTES):
+                    await self._write_snapshot_async()
+                elif data:
+                    self._log_entries += len(self._pending_log)
+                    self._log_bytes += len(data)
+                    self._pending_log.clear()
+                    await asyncio.to_thread(_append_jobs_log, data)
+            except Exception as e:
+                print(f"[JobManager] Failed to save jobs: {e}")
+
+    async def _write_snapshot_async(self):
+        """Write a full snapshot from a worker thread. Caller must hold _save_lock."""
+        job_files, index = self._serialize_jobs()
+        self._pending_log.clear()
+        self._log_entries = 0
+        self._log_bytes = 0
+        try:
+            await asyncio.to_thread(_write_jobs_snapshot, job_files, index)
+        except BaseException:
+            # The pending log lines were dropped with this snapshot, so make
+            # the next save another snapshot that includes these jobs
+            self._dirty_jobs.update(job_files)
+            self._log_entries = JOBS_LOG_COMPACT_ENTRIES
+            raise
+
+    async def _persist_now(self):
+        """Write pending changes immediately instead of waiting for the debounce."""
+        self._dirty.clear()
+        await self._save_jobs_async()
+
+    def _mark_dirty(self):
+        """Schedule a debounced save. Must be called from the event loop."""
+        self._dirty.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """Write jobs to disk whenever they change, coalescing bursts of updates."""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+            self._dirty.clear()
+            await self._save_jobs_async()
+
+    async def flush(self):
+        """Stop the background flusher, write a compacted snapshot and close the log (used on shutdown)."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        if self._dirty.is_set() or self._log_entries:
+            self._dirty.clear()
+            async with self._save_lock:
+                try:
+                    await self._write_snapshot_async()
+                except Exception as e:
+                    print(f"[JobManager] Failed to save jobs: {e}")
+        _close_jobs_log()
     
+    def _job_lock(self, job_id: str) -> asyncio.Lock:
+        """Get the lock that serializes mutations of one job."""
+        lock = self._job_locks.get(job_id)
+        if lock is None:
+            if job_id not in self._jobs:
+                # Unknown ID (e.g. from a stale client); the caller will find
+                # nothing to do, so don't leave a lock behind for it
+                return self._index_lock
+            # Jobs loaded from disk get their lock on first use
+            lock = self._job_locks[job_id] = asyncio.Lock()
+        return lock
+
+    def _append_stream_chunk(self, job_id: str, stage: str, model: str, stream: Dict[str, Any], content_chunk: str):
+        """
+        Buffer a streamed chunk in memory; appends keep accumulation O(n).
+        Once the stream passes MAX_STREAM_CHARS, the oldest chunks are dropped and
+        the entry records how many characters are missing in `truncated_chars`.
+        """
+        job_buffers = self._live_streams.get(job_id)
+        if job_buffers is None:
+            job_buffers = self._live_streams[job_id] = {}
+        buffers = job_buffers.get(stage)
+        if buffers is None:
+            buffers = job_buffers[stage] = {}
+        chunks = buffers.get(model)
+        if chunks is None:
+            chunks = buffers[model] = deque()
+        chunks.append(content_chunk)
+        stream["char_count"] += len(content_chunk)
+        
+        kept = stream["char_count"] - stream.get("truncated_chars", 0) - len(stream["content"])
+        if kept > MAX_STREAM_CHARS:
+            dropped = 0
+            while kept - dropped > MAX_STREAM_CHARS and len(chunks) > 1:
+                dropped += len(chunks.popleft())
+            if dropped:
+                stream["truncated_chars"] = stream.get("truncated_chars", 0) + dropped
+
+    def _finish_stream(self, job_id: str, stage: str, model: str, stream: Dict[str, Any]):
+        """Move a stream's buffered chunks into its job entry."""
+        buffers = self._live_streams.get(job_id)
+        if not buffers or stage not in buffers:
+            return
+        chunks = buffers[stage].pop(model, None)
+        if chunks:
+            stream["content"] += "".join(chunks)
+        if not buffers[stage]:
+            del buffers[stage]
+        if not buffers:
+            del self._live_streams[job_id]
+
+    def _finish_all_streams(self, job_id: str):
+        """Move every buffered chunk of a job into its entries (when the job ends)."""
+        buffers = self._live_streams.pop(job_id, None)
+        if not buffers:
+            return
+        progress = self._jobs[job_id]["progress"]
+        for stage, models in buffers.items():
+            for model, chunks in models.items():
+                stream = progress[stage] if stage == "stage3_stream" else progress[stage][model]
+                stream["content"] += "".join(chunks)
+
+    def _fail_open_streams(self, job_id: str):
+        """Mark streams still running when their job failed (e.g. a stage timed out) as failed."""
+        progress = self._jobs[job_id]["progress"]
+        streams = [
+            *progress["model_streams"].values(),
+            *progress["stage2_streams"].values(),
+            progress["stage3_stream"],
+        ]
+        for stream in streams:
+            if stream["status"] == "streaming":
+                stream["status"] = "failed"
+
+    def _progress_set(self, job_id: str, key: str) -> set:
+        """Get the set mirroring progress[key], building it from the list on first use."""
+        sets = self._progress_sets.setdefault(job_id, {})
+        members = sets.get(key)
+        if members is None:
+            members = sets[key] = set(self._jobs[job_id]["progress"][key])
+        return members
+
+    def _progress_add(self, job_id: str, key: str, model: str):
+        """Append a model to progress[key] unless it's already there."""
+        members = self._progress_set(job_id, key)
+        if model not in members:
+            members.add(model)
+            self._jobs[job_id]["progress"][key].append(model)
+
+    def _progress_discard(self, job_id: str, key: str, model: str):
+        """Remove a model from progress[key] if it's there."""
+        members = self._progress_set(job_id, key)
+        if model in members:
+            members.discard(model)
+            self._jobs[job_id]["progress"][key].remove(model)
+
     async def create_job(self, conversation_id: str, user_query: str) -> str:
         """
         Create a new job for a conversation.
@@ -87,16 +645,18 @@ class JobManager:
         Returns:
             The job ID
         """
-        async with self._lock:
-            job_id = str(uuid.uuid4())
+        async with self._index_lock:
+            job_id = uuid.uuid4().hex
+            now_iso = _now_iso()
             
             self._jobs[job_id] = {
                 "id": job_id,
                 "conversation_id": conversation_id,
                 "user_query": user_query,
                 "status": JobStatus.PENDING,
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
+                "created_at": now_iso,
+                "created_ts": time.time(),  # Epoch seconds, for cheap age checks
+                "updated_at": now_iso,
                 "stage1": None,
                 "stage2": None,
                 "stage3": None,
@@ -108,35 +668,129 @@ class JobManager:
                     "models_responded": [],
                     "models_pending": [],
                     "models_failed": [],
-                    "model_streams": {},  # model -> {content: str, status: 'streaming'|'complete'|'failed'}
+                    # Stream content is buffered in _live_streams until the stream finishes
+                    "model_streams": {},  # model -> {content: str, status: 'streaming'|'complete'|'failed', char_count: int}
                     "stage2_streams": {},  # model -> {content: str, status: 'streaming'|'complete'|'failed', char_count: int}
                     "stage3_stream": {"content": "", "status": "pending", "char_count": 0, "model": ""},  # chairman streaming
                 },
             }
             
             self._conversation_jobs[conversation_id] = job_id
+            self._job_locks[job_id] = asyncio.Lock()
             
-            self._save_jobs()
+            self._log({
+                "op": "create",
+                "job_id": job_id,
+                "job": _job_view(self._jobs[job_id])
+            })
             return job_id
     
-    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get job data by job ID."""
-        async with self._lock:
+    def _view(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the cached reader view of a job, building it if the job changed since."""
+        view = self._views.get(job_id)
+        if view is None:
             job = self._jobs.get(job_id)
-            if job:
-                # Return a copy without the task object
-                return {k: v for k, v in job.items() if k != "task"}
-            return None
+            if job is None:
+                return None
+            view = self._views[job_id] = _job_view(job, self._live_streams.get(job_id))
+        return view
+
+    def _changed(self, job_id: str, progress: bool = False):
+        """
+        Drop a job's cached view and wake anything waiting for it to change.
+
+        Args:
+            job_id: The job ID
+            progress: Whether the change touched the job's progress
+        """
+        self._views.pop(job_id, None)
+        self._versions[job_id] = self._versions.get(job_id, 0) + 1
+        if progress:
+            self._progress_versions[job_id] = self._progress_versions.get(job_id, 0) + 1
+        event = self._change_events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    def get_version(self, job_id: str) -> int:
+        """Get a job's change counter, to pass to wait_for_change."""
+        return self._versions.get(job_id, 0)
+
+    def get_progress_version(self, job_id: str) -> int:
+        """Get a job's progress change counter; it only moves when progress changes."""
+        return self._progress_versions.get(job_id, 0)
+
+    def get_status(self, job_id: str) -> Optional[JobStatus]:
+        """Get an in-memory job's status without building its view."""
+        job = self._jobs.get(job_id)
+        return job["status"] if job is not None else None
+
+    async def wait_for_change(self, job_id: str, version: int, timeout: float) -> int:
+        """
+        Wait until a job changes after the given version.
+
+        Args:
+            job_id: The job ID
+            version: The version the caller last saw (from get_version)
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The current version; equal to version if the wait timed out
+        """
+        if self._versions.get(job_id, 0) == version:
+            event = self._change_events.get(job_id)
+            if event is None:
+                event = self._change_events[job_id] = asyncio.Event()
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._versions.get(job_id, 0)
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get job data by job ID. Lock-free: views are built without yielding to the loop.
+        The returned dict is shared between readers and must not be modified.
+        Finished jobs that were moved out of memory are read back from their file.
+        """
+        view = self._view(job_id)
+        if view is None:
+            data = await asyncio.to_thread(_read_job_file, job_id)
+            return jsonutil.loads(data) if data else None
+        if job_id in self._finished:
+            self._finished.move_to_end(job_id)
+        return view
     
-    async def get_job_for_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
-        """Get the active job for a conversation, if any."""
-        async with self._lock:
-            job_id = self._conversation_jobs.get(conversation_id)
-            if job_id:
-                job = self._jobs.get(job_id)
-                if job:
-                    return {k: v for k, v in job.items() if k != "task"}
+    def get_stream_content(self, job_id: str, stage: str, model: str = "") -> Optional[str]:
+        """
+        Get the content streamed so far for one stream, without building a job view.
+
+        Args:
+            job_id: The job ID
+            stage: "model_streams", "stage2_streams" or "stage3_stream"
+            model: The model (ignored for "stage3_stream")
+
+        Returns:
+            The content, or None if the job or stream doesn't exist
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
             return None
+        if stage == "stage3_stream":
+            model = ""
+            stream = job["progress"]["stage3_stream"]
+        else:
+            stream = job["progress"][stage].get(model)
+            if stream is None:
+                return None
+        chunks = self._live_streams.get(job_id, {}).get(stage, {}).get(model)
+        return stream["content"] + "".join(chunks) if chunks else stream["content"]
+
+    async def get_job_for_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Get the active job for a conversation, if any. Lock-free; don't modify the result."""
+        job_id = self._conversation_jobs.get(conversation_id)
+        if job_id:
+            return self._view(job_id)
+        return None
     
     async def update_job_status(
         self,
@@ -149,30 +803,32 @@ class JobManager:
         error: Optional[str] = None
     ):
         """Update job status and data."""
-        async with self._lock:
+        async with self._job_lock(job_id):
             if job_id not in self._jobs:
                 return
             
             job = self._jobs[job_id]
-            job["status"] = status
-            job["updated_at"] = datetime.utcnow().isoformat()
-            
-            if stage1 is not None:
-                job["stage1"] = stage1
-            if stage2 is not None:
-                job["stage2"] = stage2
-            if stage3 is not None:
-                job["stage3"] = stage3
-            if metadata is not None:
-                job["metadata"] = metadata
-            if error is not None:
-                job["error"] = error
-            
-            self._save_jobs()
+            updates = (
+                ("status", status),
+                ("stage1", stage1),
+                ("stage2", stage2),
+                ("stage3", stage3),
+                ("metadata", metadata),
+                ("error", error),
+            )
+            # Only the fields that actually change are logged
+            fields = {key: value for key, value in updates if value is not None and job.get(key) != value}
+            if not fields:
+                # Nothing changed, so there's nothing to log or write
+                return
+            fields["updated_at"] = _now_iso()
+            
+            job.update(fields)
+            self._log_set(job_id, fields)
     
     async def set_job_task(self, job_id: str, task: asyncio.Task):
         """Associate an asyncio task with a job."""
-        async with self._lock:
+        async with self._job_lock(job_id):
             if job_id in self._jobs:
                 self._jobs[job_id]["task"] = task
     
@@ -184,7 +840,7 @@ class JobManager:
         model_failed: str = None,
     ):
         """Update job progress - which models have responded."""
-        async with self._lock:
+        async with self._job_lock(job_id):
             if job_id not in self._jobs:
                 return
             
@@ -195,21 +851,112 @@ class JobManager:
                 progress["models_total"] = models_total
                 # Initialize pending list with all models
                 progress["models_pending"] = []
+                self._progress_sets.get(job_id, {}).pop("models_pending", None)
             
             if model_responded:
-                if model_responded not in progress["models_responded"]:
-                    progress["models_responded"].append(model_responded)
-                if model_responded in progress["models_pending"]:
-                    progress["models_pending"].remove(model_responded)
+                self._progress_add(job_id, "models_responded", model_responded)
+                self._progress_discard(job_id, "models_pending", model_responded)
             
             if model_failed:
-                if model_failed not in progress["models_failed"]:
-                    progress["models_failed"].append(model_failed)
-                if model_failed in progress["models_pending"]:
-                    progress["models_pending"].remove(model_failed)
+                self._progress_add(job_id, "models_failed", model_failed)
+                self._progress_discard(job_id, "models_pending", model_failed)
             
-            job["updated_at"] = datetime.utcnow().isoformat()
-            self._save_jobs()
+            job["updated_at"] = _now_iso()
+            self._changed(job_id, progress=True)
+            # Not persisted: progress is derivable from model_streams, and the
+            # next status change is logged anyway
+    
+    def _apply_stream_update(
+        self,
+        job_id: str,
+        stage: str,
+        model: Optional[str],
+        content_chunk: Optional[str],
+        status: Optional[str],
+    ):
+        """
+        Apply one update to a stream. Never awaits, so it is atomic on the event loop.
+
+        Args:
+            job_id: The job ID
+            stage: "model_streams", "stage2_streams" or "stage3_stream"
+            model: The streaming model (for Stage 3, the chairman to record, if any)
+            content_chunk: Text to append, if any
+            status: New stream status, if any
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        progress = job["progress"]
+        
+        if stage == "stage3_stream":
+            stream = progress[stage]
+            if model:
+                stream["model"] = model
+            buffer_key = ""
+        else:
+            streams = progress[stage]
+            stream = streams.get(model)
+            if stream is None:
+                stream = streams[model] = {"content": "", "status": "streaming", "char_count": 0}
+            buffer_key = model
+        
+        if content_chunk:
+            self._append_stream_chunk(job_id, stage, buffer_key, stream, content_chunk)
+        
+        if status:
+            stream["status"] = status
+        
+        # Don't save on every chunk - too expensive
+        # Only save when the stream finishes
+        if status in _STREAM_PERSIST_STATUSES:
+            self._finish_stream(job_id, stage, buffer_key, stream)
+            if stage == "stage3_stream":
+                self._log_set(job_id, {stage: stream}, path=("progress",))
+            else:
+                self._log_set(job_id, {model: stream}, path=("progress", stage))
+        else:
+            self._changed(job_id, progress=True)
+    
+    async def _update_stream(
+        self,
+        job_id: str,
+        stage: str,
+        model: Optional[str],
+        content_chunk: Optional[str],
+        status: Optional[str],
+    ):
+        """Apply a stream update; chunk-only updates skip the job lock."""
+        if status is None:
+            # Per-chunk hot path: the update can't interleave with a locked
+            # mutation (those don't await either), so taking the lock buys nothing
+            self._apply_stream_update(job_id, stage, model, content_chunk, None)
+            return
+        async with self._job_lock(job_id):
+            self._apply_stream_update(job_id, stage, model, content_chunk, status)
+    
+    async def init_streams(self, job_id: str, stage: str, models: List[str], status: str = "streaming"):
+        """
+        Set the status of all of a stage's model streams at once, creating them as needed.
+
+        Args:
+            job_id: The job ID
+            stage: "model_streams" or "stage2_streams"
+            models: The models whose streams to set
+            status: The status to set
+        """
+        async with self._job_lock(job_id):
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            streams = job["progress"][stage]
+            for model in models:
+                stream = streams.get(model)
+                if stream is None:
+                    streams[model] = {"content": "", "status": status, "char_count": 0}
+                else:
+                    stream["status"] = status
+            self._changed(job_id, progress=True)
     
     async def update_model_stream(
         self,
@@ -219,27 +966,7 @@ class JobManager:
         status: str = None,  # 'streaming', 'complete', 'failed'
     ):
         """Update streaming content for a specific model (Stage 1)."""
-        async with self._lock:
-            if job_id not in self._jobs:
-                return
-            
-            job = self._jobs[job_id]
-            streams = job["progress"]["model_streams"]
-            
-            if model not in streams:
-                streams[model] = {"content": "", "status": "streaming", "char_count": 0}
-            
-            if content_chunk:
-                streams[model]["content"] += content_chunk
-                streams[model]["char_count"] = len(streams[model]["content"])
-            
-            if status:
-                streams[model]["status"] = status
-            
-            # Don't save on every chunk - too expensive
-            # Only save on status changes
-            if status:
-                self._save_jobs()
+        await self._update_stream(job_id, "model_streams", model, content_chunk, status)
     
     async def update_stage2_stream(
         self,
@@ -249,26 +976,7 @@ class JobManager:
         status: str = None,  # 'streaming', 'complete', 'failed'
     ):
         """Update streaming content for a specific model during Stage 2 (rankings)."""
-        async with self._lock:
-            if job_id not in self._jobs:
-                return
-            
-            job = self._jobs[job_id]
-            streams = job["progress"]["stage2_streams"]
-            
-            if model not in streams:
-                streams[model] = {"content": "", "status": "streaming", "char_count": 0}
-            
-            if content_chunk:
-                streams[model]["content"] += content_chunk
-                streams[model]["char_count"] = len(streams[model]["content"])
-            
-            if status:
-                streams[model]["status"] = status
-            
-            # Only save on status changes
-            if status:
-                self._save_jobs()
+        await self._update_stream(job_id, "stage2_streams", model, content_chunk, status)
     
     async def update_stage3_stream(
         self,
@@ -278,30 +986,11 @@ class JobManager:
         status: str = None,  # 'streaming', 'complete', 'failed'
     ):
         """Update streaming content for Stage 3 (chairman synthesis)."""
-        async with self._lock:
-            if job_id not in self._jobs:
-                return
-            
-            job = self._jobs[job_id]
-            stream = job["progress"]["stage3_stream"]
-            
-            if model:
-                stream["model"] = model
-            
-            if content_chunk:
-                stream["content"] += content_chunk
-                stream["char_count"] = len(stream["content"])
-            
-            if status:
-                stream["status"] = status
-            
-            # Only save on status changes
-            if status:
-                self._save_jobs()
+        await self._update_stream(job_id, "stage3_stream", model, content_chunk, status)
     
     async def complete_job(self, job_id: str):
         """Mark a job as complete and clean up."""
-        async with self._lock:
+        async with self._job_lock(job_id):
             if job_id not in self._jobs:
                 return
             
@@ -314,51 +1003,62 @@ class JobManager:
             
             # Keep job data for a while (could add TTL cleanup later)
             job["task"] = None
+            self._finish_all_streams(job_id)
             
-            self._save_jobs()
+            self._log_conversation_end(job_id, conversation_id)
+            self._mark_finished(job_id)
+        
+        # The end of a job is a durability point
+        await self._persist_now()
+        await self._evict_finished_jobs()
     
     async def fail_job(self, job_id: str, error: str):
         """Mark a job as failed."""
-        async with self._lock:
+        async with self._job_lock(job_id):
             if job_id not in self._jobs:
                 return
             
             job = self._jobs[job_id]
-            job["status"] = JobStatus.ERROR
-            job["error"] = error
-            job["updated_at"] = datetime.utcnow().isoformat()
+            fields = {
+                "status": JobStatus.ERROR,
+                "error": error,
+                "updated_at": _now_iso()
+            }
+            job.update(fields)
             
             conversation_id = job["conversation_id"]
             if self._conversation_jobs.get(conversation_id) == job_id:
                 del self._conversation_jobs[conversation_id]
             
             job["task"] = None
+            self._finish_all_streams(job_id)
+            self._fail_open_streams(job_id)
             
-            self._save_jobs()
+            self._log_set(job_id, fields)
+            self._log_conversation_end(job_id, conversation_id)
+            self._mark_finished(job_id)
+        
+        await self._persist_now()
+        await self._evict_finished_jobs()
     
     async def is_job_running(self, conversation_id: str) -> bool:
-        """Check if there's an active job for a conversation."""
-        async with self._lock:
-            job_id = self._conversation_jobs.get(conversation_id)
-            if not job_id:
-                return False
-            
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
-            
-            return job["status"] not in [JobStatus.COMPLETE, JobStatus.ERROR]
+        """
+        Check if there's an active job for a conversation. Lock-free; the answer
+        may be stale by the time the caller acts on it, as with any polled status.
+        """
+        job = self._jobs.get(self._conversation_jobs.get(conversation_id))
+        return job is not None and job["status"] not in TERMINAL_STATUSES
     
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job."""
-        async with self._lock:
+        async with self._job_lock(job_id):
             if job_id not in self._jobs:
                 return False
             
             job = self._jobs[job_id]
             
             # Only cancel if still running
-            if job["status"] in [JobStatus.COMPLETE, JobStatus.ERROR]:
+            if job["status"] in TERMINAL_STATUSES:
                 return False
             
             # Cancel the asyncio task if it exists
@@ -366,77 +1066,143 @@ class JobManager:
             if task and not task.done():
                 task.cancel()
             
-            job["status"] = JobStatus.ERROR
-            job["error"] = "Job cancelled by user"
-            job["updated_at"] = datetime.utcnow().isoformat()
+            fields = {
+                "status": JobStatus.ERROR,
+                "error": "Job cancelled by user",
+                "updated_at": _now_iso()
+            }
+            job.update(fields)
             
             conversation_id = job["conversation_id"]
             if self._conversation_jobs.get(conversation_id) == job_id:
                 del self._conversation_jobs[conversation_id]
             
             job["task"] = None
+            self._finish_all_streams(job_id)
+            self._fail_open_streams(job_id)
             
-            self._save_jobs()
-            return True
+            self._log_set(job_id, fields)
+            self._log_conversation_end(job_id, conversation_id)
+            self._mark_finished(job_id)
+        
+        await self._persist_now()
+        await self._evict_finished_jobs()
+        return True
     
     async def cleanup_old_jobs(self, max_age_hours: int = 24):
         """Remove completed/failed jobs older than max_age_hours."""
-        async with self._lock:
-            now = datetime.utcnow()
+        async with self._index_lock:
+            cutoff = time.time() - max_age_hours * 3600
             to_remove = []
             
-            for job_id, job in self._jobs.items():
-                if job["status"] in [JobStatus.COMPLETE, JobStatus.ERROR]:
-                    created = datetime.fromisoformat(job["created_at"])
-                    age_hours = (now - created).total_seconds() / 3600
-                    if age_hours > max_age_hours:
-                        to_remove.append(job_id)
+            # Only the expired jobs are visited, oldest first
+            heap = self._finished_heap
+            while heap and heap[0][0] < cutoff:
+                _, job_id = heapq.heappop(heap)
+                job = self._jobs.get(job_id)
+                if job is not None and job["status"] in TERMINAL_STATUSES:
+                    to_remove.append(job_id)
             
             for job_id in to_remove:
-                del self._jobs[job_id]
+                self._forget_job(job_id)
+                self._log({"op": "delete", "job_id": job_id})
             
-            if to_remove:
-                self._save_jobs()
+            # Spilled jobs are only on disk; their file's age stands in for the job's
+            try:
+                await asyncio.to_thread(_prune_job_files, cutoff, to_remove, list(self._jobs))
+            except Exception as e:
+                print(f"[JobManager] Failed to prune job files: {e}")
+
+    def _mark_finished(self, job_id: str):
+        """Track a job that just finished for eviction and TTL cleanup."""
+        self._finished[job_id] = None
+        heapq.heappush(self._finished_heap, (_created_ts(self._jobs[job_id]), job_id))
+
+    def _forget_job(self, job_id: str):
+        """Drop a job and all of its in-memory state."""
+        self._jobs.pop(job_id, None)
+        self._job_locks.pop(job_id, None)
+        self._live_streams.pop(job_id, None)
+        self._views.pop(job_id, None)
+        self._progress_sets.pop(job_id, None)
+        self._finished.pop(job_id, None)
+        self._versions.pop(job_id, None)
+        self._progress_versions.pop(job_id, None)
+        # Wake any waiters so they notice the job is gone (or read it from its file)
+        event = self._change_events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    async def _evict_finished_jobs(self):
+        """Move the least recently used finished jobs beyond the in-memory cap to their own files."""
+        while len(self._finished) > MAX_FINISHED_JOBS_IN_MEMORY:
+            job_id, _ = self._finished.popitem(last=False)
+            job = self._jobs.get(job_id)
+            if job is None:
+                continue
+            try:
+                await asyncio.to_thread(_write_job_file, job_id, jsonutil.dumps(_job_view(job)))
+            except Exception as e:
+                # Keep it in memory (and in the snapshot) rather than lose it
+                print(f"[JobManager] Failed to spill job {job_id}: {e}")
+                continue
+            self._forget_job(job_id)
+            # Drops the job from the snapshot; get_job reads it from its file instead
+            self._log({"op": "delete", "job_id": job_id})
 
     async def skip_model(self, job_id: str, model: str) -> bool:
         """
         Mark a model as skipped for a job.
         Returns True if successful, False if job not found or not in stage1.
         """
-        async with self._lock:
+        async with self._job_lock(job_id):
             if job_id not in self._jobs:
                 return False
             
             job = self._jobs[job_id]
-            if job["status"] not in [JobStatus.STAGE1_RUNNING, JobStatus.PENDING]:
+            if job["status"] not in _SKIPPABLE_STATUSES:
                 return False
             
-            # Add to skipped models set
-            if job_id not in self._skipped_models:
-                self._skipped_models[job_id] = set()
-            self._skipped_models[job_id].add(model)
+            # Swap in a new skipped models set
+            self._skipped_models[job_id] = self._skipped_models.get(job_id, frozenset()) | {model}
+            self._skip_events.setdefault(job_id, {}).setdefault(model, asyncio.Event()).set()
+            self.get_control_event(job_id).set()
             
             # Update model stream status to 'skipped'
             streams = job["progress"]["model_streams"]
             if model in streams:
                 streams[model]["status"] = "skipped"
+                self._finish_stream(job_id, "model_streams", model, streams[model])
+                self._log_set(job_id, {model: streams[model]}, path=("progress", "model_streams"))
             
             # Add to failed list for tracking
-            if model not in job["progress"]["models_failed"]:
-                job["progress"]["models_failed"].append(model)
+            self._progress_add(job_id, "models_failed", model)
+            self._log_set(job_id, {"models_failed": job["progress"]["models_failed"]}, path=("progress",))
             
-            job["updated_at"] = datetime.utcnow().isoformat()
-            self._save_jobs()
+            job["updated_at"] = _now_iso()
+            self._log_set(job_id, {"updated_at": job["updated_at"]})
             return True
 
     def is_model_skipped(self, job_id: str, model: str) -> bool:
         """Check if a model has been skipped. Thread-safe read."""
-        # Note: This is a simple read operation. The dict.get() is atomic in CPython
-        # and we're only reading, so this is safe without explicit locking.
-        skipped = self._skipped_models.get(job_id)
-        if skipped is None:
-            return False
-        return model in skipped
+        # Lock-free: the dict.get() is atomic in CPython and the set it returns is
+        # immutable (skip_model replaces it), so this is safe without explicit locking.
+        return model in self._skipped_models.get(job_id, ())
+
+    def get_skip_events(self, job_id: str, models: List[str]) -> Dict[str, asyncio.Event]:
+        """Get the per-model events that are set when a model is skipped."""
+        events = self._skip_events.setdefault(job_id, {})
+        for model in models:
+            events.setdefault(model, asyncio.Event())
+        return events
+
+    def get_force_continue_event(self, job_id: str) -> asyncio.Event:
+        """Get the event that is set when the job should force continue to stage 2."""
+        return self._force_continue_events.setdefault(job_id, asyncio.Event())
+
+    def get_control_event(self, job_id: str) -> asyncio.Event:
+        """Get the event that is set whenever a model is skipped or the job is forced to continue."""
+        return self._control_events.setdefault(job_id, asyncio.Event())
 
     async def force_continue_to_stage2(self, job_id: str, min_required: int = 1) -> bool:
         """
@@ -449,7 +1215,7 @@ class JobManager:
         Returns:
             True if successful, False if job not found, not in stage1, or insufficient responses
         """
-        async with self._lock:
+        async with self._job_lock(job_id):
             if job_id not in self._jobs:
                 return False
             
@@ -462,29 +1228,36 @@ class JobManager:
             if completed < min_required:
                 return False
             
-            self._force_continue[job_id] = True
-            job["updated_at"] = datetime.utcnow().isoformat()
-            self._save_jobs()
+            self.get_force_continue_event(job_id).set()
+            self.get_control_event(job_id).set()
+            job["updated_at"] = _now_iso()
+            self._log_set(job_id, {"updated_at": job["updated_at"]})
             return True
 
     def should_force_continue(self, job_id: str) -> bool:
         """Check if the job should force continue to stage 2. Thread-safe read."""
         # Note: This is a simple read operation. The dict.get() is atomic in CPython.
-        return self._force_continue.get(job_id, False)
+        event = self._force_continue_events.get(job_id)
+        return event is not None and event.is_set()
 
     def get_completed_count(self, job_id: str) -> int:
-        """Get the number of completed model responses for a job."""
-        if job_id not in self._jobs:
+        """Get the number of completed model responses for a job. Lock-free."""
+        job = self._jobs.get(job_id)
+        if job is None:
             return 0
-        return len(self._jobs[job_id]["progress"]["models_responded"])
+        return len(job["progress"]["models_responded"])
 
     async def cleanup_job_state(self, job_id: str):
         """Clean up temporary state for a job (called when job completes)."""
-        async with self._lock:
+        async with self._job_lock(job_id):
             if job_id in self._skipped_models:
                 del self._skipped_models[job_id]
-            if job_id in self._force_continue:
-                del self._force_continue[job_id]
+            if job_id in self._skip_events:
+                del self._skip_events[job_id]
+            if job_id in self._force_continue_events:
+                del self._force_continue_events[job_id]
+            self._control_events.pop(job_id, None)
+            self._progress_sets.pop(job_id, None)
 
 
 # Global job manager instance
@@ -0,0 +1,34 @@
+"""JSON helpers that use orjson when it is installed, falling back to the stdlib."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """Serialize obj to indented UTF-8 JSON bytes (for files people read)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    loads = orjson.loads
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """Serialize obj to indented UTF-8 JSON bytes (for files people read)."""
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+    loads = json.loads
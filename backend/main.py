@@ -11,37 +11,62 @@ logging.basicConfig(
     stream=sys.stdout
 )
 logger = logging.getLogger('council')
-logger.setLevel(logging.DEBUG)
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Awaitable
 import uuid
-import json
 import asyncio
+import functools
+import re
+import time
 
 from . import storage
-from .council import run_full_council, generate_conversation_title, stage1_collect_responses, stage1_collect_responses_streaming, stage2_collect_rankings, stage2_collect_rankings_streaming, stage3_synthesize_final, stage3_synthesize_final_streaming, calculate_aggregate_rankings
-from .openrouter import fetch_available_models
+from . import jsonutil
+from .council import run_full_council, generate_conversation_title, stage1_collect_responses, stage1_collect_responses_streaming, stage2_collect_rankings, stage2_collect_rankings_streaming, stage3_synthesize_final, stage3_synthesize_final_streaming, stage3_prewarm, calculate_aggregate_rankings
+from .openrouter import fetch_available_models, close_client, warm_up_connections
 from . import config
-from .jobs import job_manager, JobStatus
+from .jobs import job_manager, JobStatus, TERMINAL_STATUSES
 from .debate import run_debate, DEBATE_ROLES
 
+logger.setLevel(config.LOG_LEVEL)
+
 app = FastAPI(title="LLM Council API")
 
+# Background connection warm-up task (kept referenced so it isn't garbage collected)
+_warmup_task: Optional[asyncio.Task] = None
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_BACKGROUND_TASKS: set = set()
+
 @app.on_event("startup")
 async def startup_event():
-    """Log startup information."""
+    """Log startup information and pre-warm OpenRouter connections."""
+    global _warmup_task
     logger.info("=" * 60)
     logger.info("LLM COUNCIL API STARTING")
     logger.info("=" * 60)
     logger.info(f"API Key: {'✓ Loaded' if config.OPENROUTER_API_KEY else '✗ MISSING!'}")
     logger.info(f"Council Models: {config.get_council_models() or '(none configured)'}")
     logger.info(f"Chairman Model: {config.get_chairman_model() or '(none configured)'}")
+    logger.info(f"Event Loop: {type(asyncio.get_running_loop()).__module__}")
     logger.info("=" * 60)
 
+    # Prime one connection per council model so the first request skips the TLS handshakes
+    _warmup_task = asyncio.create_task(
+        warm_up_connections(len(config.get_council_models()) + 1)
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write pending job and conversation state and release pooled OpenRouter connections."""
+    await job_manager.flush()
+    await storage.conversation_writer.flush()
+    await close_client()
+
 # Enable CORS for local development
 app.add_middleware(
     CORSMiddleware,
@@ -49,8 +74,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers reuse a preflight for a day instead of repeating it per request
+    max_age=86400,
 )
 
+# Response headers for the event streams; X-Accel-Buffering stops nginx-style
+# reverse proxies from buffering the stream
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
 
 class CreateConversationRequest(BaseModel):
     """Request to create a new conversation."""
@@ -99,10 +134,19 @@ async def root():
     return {"status": "ok", "service": "LLM Council API"}
 
 
+def _json_response(data: Any) -> Response:
+    """
+    Encode a response body directly. Storage already returns dicts in the shape of
+    the declared response_model, so FastAPI's per-field validation is skipped.
+    """
+    return Response(content=jsonutil.dumps(data), media_type="application/json")
+
+
 @app.get("/api/conversations", response_model=List[ConversationMetadata])
 async def list_conversations():
     """List all conversations (metadata only)."""
-    return storage.list_conversations()
+    conversations = await storage.conversation_writer.read(None, storage.list_conversations)
+    return _json_response(conversations)
 
 
 @app.post("/api/jobs/{job_id}/cancel")
@@ -142,57 +186,90 @@ async def force_continue(job_id: str):
 async def create_conversation(request: CreateConversationRequest):
     """Create a new conversation."""
     conversation_id = str(uuid.uuid4())
-    conversation = storage.create_conversation(conversation_id)
-    return conversation
+    conversation = await storage.conversation_writer.write(storage.create_conversation, conversation_id)
+    conversation["pending_job"] = None
+    return _json_response(conversation)
 
 
 @app.get("/api/conversations/{conversation_id}", response_model=Conversation)
 async def get_conversation(conversation_id: str):
     """Get a specific conversation with all its messages, including any pending job."""
-    conversation = storage.get_conversation(conversation_id)
+    conversation = await storage.conversation_writer.read(conversation_id, storage.get_conversation, conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
     # Check if there's an active job for this conversation
     job = await job_manager.get_job_for_conversation(conversation_id)
-    if job and job["status"] not in [JobStatus.COMPLETE, JobStatus.ERROR]:
+    if job and job["status"] not in TERMINAL_STATUSES:
         conversation["pending_job"] = job
     else:
         conversation["pending_job"] = None
     
-    return conversation
+    return _json_response(conversation)
 
 
 @app.delete("/api/conversations/{conversation_id}")
 async def delete_conversation(conversation_id: str):
     """Delete a conversation."""
-    deleted = storage.delete_conversation(conversation_id)
+    await storage.conversation_writer.flush(conversation_id)
+    deleted = await storage.conversation_writer.write(storage.delete_conversation, conversation_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return {"success": True, "id": conversation_id}
 
 
-@app.post("/api/conversations/{conversation_id}/message")
-async def send_message(conversation_id: str, request: SendMessageRequest):
+async def _generate_title(conversation_id: str, user_query: str):
+    """Generate a conversation's title and save it (non-critical)."""
+    try:
+        title = await asyncio.wait_for(generate_conversation_title(user_query), timeout=TITLE_TIMEOUT_SECONDS)
+        logger.debug("Title generated for %s: %s", conversation_id[:8], title)
+        storage.conversation_writer.update_title(conversation_id, title)
+    except Exception as title_error:
+        logger.warning(f"Title generation failed (non-critical): {title_error!r}")
+
+
+def _start_title(conversation_id: str, user_query: str):
     """
-    Send a message and run the 3-stage council process.
-    Returns the complete response with all stages.
+    Generate a conversation's title in the background, alongside the council.
+    It depends only on the query, and is saved as soon as it is ready, so it
+    never holds up a response or a job.
     """
-    # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
-    if conversation is None:
+    task = asyncio.create_task(_generate_title(conversation_id, user_query))
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+async def _prepare_message(conversation_id: str, content: str):
+    """
+    Add a user message to a conversation, and start titling it if it's the first.
+    Shared by the plain and streaming message endpoints.
+
+    Args:
+        conversation_id: Conversation identifier
+        content: User message content
+
+    Raises:
+        HTTPException: 404 if the conversation doesn't exist
+    """
+    await storage.conversation_writer.flush(conversation_id)
+    begun = await storage.conversation_writer.write(storage.begin_message, conversation_id, content)
+    if begun is None:
+        logger.error(f"Conversation {conversation_id} not found!")
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Check if this is the first message
-    is_first_message = len(conversation["messages"]) == 0
+    # The title depends only on the first message, so it is generated alongside the council
+    if begun["is_first"]:
+        logger.debug("Starting title generation for conversation %s", conversation_id[:8])
+        _start_title(conversation_id, content)
 
-    # Add user message
-    storage.add_user_message(conversation_id, request.content)
 
-    # If this is the first message, generate a title
-    if is_first_message:
-        title = await generate_conversation_title(request.content)
-        storage.update_conversation_title(conversation_id, title)
+@app.post("/api/conversations/{conversation_id}/message")
+async def send_message(conversation_id: str, request: SendMessageRequest):
+    """
+    Send a message and run the 3-stage council process.
+    Returns the complete response with all stages.
+    """
+    await _prepare_message(conversation_id, request.content)
 
     # Run the 3-stage council process
     stage1_results, stage2_results, stage3_result, metadata = await run_full_council(
@@ -200,7 +277,8 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     )
 
     # Add assistant message with all stages
-    storage.add_assistant_message(
+    await storage.conversation_writer.write(
+        storage.add_assistant_message,
         conversation_id,
         stage1_results,
         stage2_results,
@@ -209,29 +287,180 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     )
 
     # Return the complete response with metadata
-    return {
+    return _json_response({
         "stage1": stage1_results,
         "stage2": stage2_results,
         "stage3": stage3_result,
         "metadata": metadata
-    }
+    })
+
+
+# Cap on background title generation, measured from when it starts. Generous, since the
+# title call can queue behind the council's streams for a model slot and blocks nothing.
+TITLE_TIMEOUT_SECONDS = 120.0
+STREAM_KEEPALIVE_SECONDS = 15.0  # Idle time before a keepalive comment is sent
+STREAM_FRAME_INTERVAL = 0.05  # Min time between progress frames while only content changes
 
 
-JOB_TIMEOUT_SECONDS = 600  # 10 minute max for entire job
+def _sse(event: Dict[str, Any]) -> bytes:
+    """Encode an event as a server-sent events frame."""
+    return b"data: " + jsonutil.dumps(event) + b"\n\n"
 
-async def run_council_job(job_id: str, conversation_id: str, user_query: str, is_first_message: bool):
+
+@functools.lru_cache(maxsize=256)
+def _chunk_frame_prefix(event_type: str, model: str) -> bytes:
+    """Encode the fixed start of a model's chunk frame, up to its content value."""
+    return b'data: {"type":' + jsonutil.dumps(event_type) + b',"model":' + jsonutil.dumps(model) + b',"content":'
+
+
+def _progress_shape(progress: Dict[str, Any], streams_key: str) -> tuple:
+    """Summarize a stage's progress without its streamed text, to spot content-only changes."""
+    return (
+        tuple((k, len(v) if isinstance(v, list) else v) for k, v in progress.items() if not isinstance(v, dict)),
+        tuple((m, s.get("status")) for m, s in progress.get(streams_key, {}).items()),
+    )
+
+
+# Stages whose models stream in parallel: status -> (event prefix, progress key of their streams)
+_PARALLEL_STREAM_STAGES = {
+    JobStatus.STAGE1_RUNNING: ("stage1", "model_streams"),
+    JobStatus.STAGE2_RUNNING: ("stage2", "stage2_streams"),
+}
+
+# Frames that never change, encoded once
+_STAGE1_START_FRAME = _sse({'type': 'stage1_start'})
+_STAGE2_START_FRAME = _sse({'type': 'stage2_start'})
+_STAGE3_START_FRAME = _sse({'type': 'stage3_start'})
+_COMPLETE_FRAME = _sse({'type': 'complete'})
+_KEEPALIVE_FRAME = b": keepalive\n\n"
+
+class ChunkBatcher:
+    """
+    Buffers streamed chunks per model and applies them in batches.
+    Each model's chunks are joined and flushed every interval, or as soon as its
+    batch size is reached. The batch size starts small, so the first tokens show
+    right away, grows with every flush while a model keeps streaming, and drops
+    back once the model goes quiet.
+    """
+
+    # A model idle for this long starts again from the minimum batch size
+    IDLE_RESET_SECONDS = 0.2
+
+    def __init__(
+        self,
+        apply: Callable[[str, str], Awaitable[None]],
+        interval: float,
+        min_size: Optional[int] = None,
+        growth: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            apply: Called with (model, joined chunks) for each flushed batch
+            interval: Seconds between flushes; 0 applies every chunk directly
+            min_size: Starting batch size, in chunks (default STREAM_MIN_BATCH_SIZE)
+            growth: Batch size multiplier per flush (default STREAM_BATCH_GROWTH)
+            max_size: Largest batch size (default STREAM_MAX_BATCH_SIZE)
+        """
+        self._apply = apply
+        self._interval = interval
+        self._min_size = max(1, min_size or config.STREAM_MIN_BATCH_SIZE)
+        self._growth = max(1, growth or config.STREAM_BATCH_GROWTH)
+        self._max_size = max(self._min_size, max_size or config.STREAM_MAX_BATCH_SIZE)
+        self._buffers: Dict[str, List[str]] = {}
+        # model -> current batch size, and when its last chunk arrived
+        self._sizes: Dict[str, int] = {}
+        self._last_chunk_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def add(self, model: str, chunk: str):
+        """Buffer a chunk for a model."""
+        if self._interval <= 0:
+            await self._apply(model, chunk)
+            return
+        now = time.monotonic()
+        if now - self._last_chunk_at.get(model, now) > self.IDLE_RESET_SECONDS:
+            self._sizes.pop(model, None)
+        self._last_chunk_at[model] = now
+        
+        buffer = self._buffers.setdefault(model, [])
+        buffer.append(chunk)
+        if len(buffer) >= self._sizes.get(model, self._min_size):
+            await self.flush(model)
+        elif self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self, model: str):
+        """Apply a model's buffered chunks now (call before changing its stream status)."""
+        buffer = self._buffers.pop(model, None)
+        if buffer:
+            self._sizes[model] = min(self._sizes.get(model, self._min_size) * self._growth, self._max_size)
+            await self._apply(model, "".join(buffer))
+
+    async def close(self):
+        """Apply everything still buffered and stop the flush timer."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for model in list(self._buffers):
+            await self.flush(model)
+
+    async def _run(self):
+        """Flush all buffers every interval until they stay empty."""
+        try:
+            while self._buffers:
+                await asyncio.sleep(self._interval)
+                for model in list(self._buffers):
+                    await self.flush(model)
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+
+async def _run_stage(stage: int, coro: Awaitable, timeout: float):
+    """
+    Await a council stage, failing it once its time limit passes.
+
+    Args:
+        stage: Stage number, for the error message
+        coro: The stage coroutine
+        timeout: Limit in seconds (0 = none)
+
+    Returns:
+        The stage's result
+    """
+    try:
+        return await asyncio.wait_for(coro, timeout or None)
+    except asyncio.TimeoutError:
+        raise RuntimeError(f"Stage {stage} exceeded {timeout:g}s") from None
+
+
+async def _commit_stage(job_id: str, conversation_id: str, status: JobStatus, **results):
+    """
+    Record a finished stage on the job and in the conversation file.
+    The save is queued before the job changes, and conversation reads flush the
+    queue first, so no reader sees the job past a stage the file doesn't have yet.
+
+    Args:
+        job_id: The job ID
+        conversation_id: The job's conversation
+        status: The job status marking the stage as done
+        **results: stage1, stage2, stage3 and/or metadata
+    """
+    storage.conversation_writer.save_partial(conversation_id, **results)
+    await job_manager.update_job_status(job_id, status, **results)
+
+
+async def run_council_job(job_id: str, conversation_id: str, user_query: str):
     """
     Run the council process as a background job.
     This runs independently of client connections.
     """
-    logger.info(f"[Job {job_id[:8]}] Starting council job (timeout: {JOB_TIMEOUT_SECONDS}s)...")
+    logger.info(
+        f"[Job {job_id[:8]}] Starting council job (stage timeouts: {config.STAGE1_TIMEOUT_SECONDS:g}s/"
+        f"{config.STAGE2_TIMEOUT_SECONDS:g}s/{config.STAGE3_TIMEOUT_SECONDS:g}s)..."
+    )
     try:
-        # Start title generation in parallel (don't await yet)
-        title_task = None
-        if is_first_message:
-            logger.debug(f"[Job {job_id[:8]}] Starting title generation task")
-            title_task = asyncio.create_task(generate_conversation_title(user_query))
-
         # Stage 1: Collect responses with streaming
         logger.info(f"[Job {job_id[:8]}] ▶ STAGE 1: Collecting individual responses (streaming)...")
         await job_manager.update_job_status(job_id, JobStatus.STAGE1_RUNNING)
@@ -241,15 +470,21 @@ async def run_council_job(job_id: str, conversation_id: str, user_query: str, is
         await job_manager.update_job_progress(job_id, models_total=len(models))
         
         # Initialize model streams
-        for model in models:
-            await job_manager.update_model_stream(job_id, model, status='streaming')
+        await job_manager.init_streams(job_id, "model_streams", models)
+        
+        async def apply_chunks(model: str, chunk: str):
+            await job_manager.update_model_stream(job_id, model, content_chunk=chunk)
+        
+        batch_interval = config.STREAM_BATCH_MS / 1000
+        stage1_batcher = ChunkBatcher(apply_chunks, batch_interval)
         
         async def on_chunk(model: str, chunk: str):
             """Called for each chunk of text from a model."""
-            await job_manager.update_model_stream(job_id, model, content_chunk=chunk)
+            await stage1_batcher.add(model, chunk)
         
         async def on_model_complete(model: str, success: bool):
             """Called when each model finishes."""
+            await stage1_batcher.flush(model)
             if success:
                 logger.info(f"[Job {job_id[:8]}] ✓ {model} complete")
                 await job_manager.update_model_stream(job_id, model, status='complete')
@@ -259,23 +494,40 @@ async def run_council_job(job_id: str, conversation_id: str, user_query: str, is
                 await job_manager.update_model_stream(job_id, model, status='failed')
                 await job_manager.update_job_progress(job_id, model_failed=model)
         
-        # Create callbacks for skip/force-continue checks
-        def should_skip_model(model: str) -> bool:
-            return job_manager.is_model_skipped(job_id, model)
+        # Events set by the skip-model / force-continue endpoints
+        skip_events = job_manager.get_skip_events(job_id, models)
+        stop_event = job_manager.get_force_continue_event(job_id)
+        control_event = job_manager.get_control_event(job_id)
         
-        def should_force_continue() -> bool:
-            return job_manager.should_force_continue(job_id)
+        # Past its time limit, Stage 1 continues with what it has, as if forced to
+        stage1_timer = None
+        if config.STAGE1_TIMEOUT_SECONDS > 0:
+            def stage1_timed_out():
+                logger.warning(f"[Job {job_id[:8]}] Stage 1 exceeded {config.STAGE1_TIMEOUT_SECONDS:g}s, continuing with the responses so far")
+                stop_event.set()
+                control_event.set()
+            stage1_timer = asyncio.get_running_loop().call_later(config.STAGE1_TIMEOUT_SECONDS, stage1_timed_out)
         
-        stage1_results = await stage1_collect_responses_streaming(
-            user_query, 
-            on_chunk, 
-            on_model_complete,
-            should_skip_model,
-            should_force_continue
-        )
+        # All council requests start together, on connections pre-warmed at startup
+        # (one per model); see stage1_collect_responses_streaming
+        try:
+            stage1_results = await stage1_collect_responses_streaming(
+                user_query, 
+                on_chunk, 
+                on_model_complete,
+                skip_events,
+                stop_event,
+                models=models,
+                control_event=control_event
+            )
+        finally:
+            if stage1_timer:
+                stage1_timer.cancel()
+        await stage1_batcher.close()
         logger.info(f"[Job {job_id[:8]}] ✓ STAGE 1 COMPLETE: Got {len(stage1_results)} responses")
-        for r in stage1_results:
-            logger.debug(f"  - {r['model']}: {len(r['response'])} chars")
+        if logger.isEnabledFor(logging.DEBUG):
+            for r in stage1_results:
+                logger.debug("  - %s: %d chars", r['model'], len(r['response']))
         
         # Check if we got any responses - fail gracefully if not
         if not stage1_results:
@@ -285,27 +537,35 @@ async def run_council_job(job_id: str, conversation_id: str, user_query: str, is
             await job_manager.cleanup_job_state(job_id)
             return
         
-        await job_manager.update_job_status(job_id, JobStatus.STAGE1_COMPLETE, stage1=stage1_results)
-        
-        # Save stage 1 results immediately to prevent data loss
-        storage.save_partial_assistant_message(conversation_id, stage1=stage1_results)
+        # Save stage 1 results right away to prevent data loss
+        await _commit_stage(job_id, conversation_id, JobStatus.STAGE1_COMPLETE, stage1=stage1_results)
 
         # Stage 2: Collect rankings (skip if only 1 response - nothing to rank)
         if len(stage1_results) >= 2:
+            if config.STAGE3_PROMPT_PREWARM:
+                # Let the chairman's provider cache the Stage 1 part of its prompt meanwhile
+                prewarm_task = asyncio.create_task(stage3_prewarm(user_query, stage1_results))
+                _BACKGROUND_TASKS.add(prewarm_task)
+                prewarm_task.add_done_callback(_BACKGROUND_TASKS.discard)
+            
             logger.info(f"[Job {job_id[:8]}] ▶ STAGE 2: Collecting peer rankings (streaming)...")
             await job_manager.update_job_status(job_id, JobStatus.STAGE2_RUNNING)
             
             # Initialize stage2 streams for all models
-            models = config.get_council_models()
-            for model in models:
-                await job_manager.update_stage2_stream(job_id, model, status='streaming')
+            await job_manager.init_streams(job_id, "stage2_streams", models)
+            
+            async def apply_stage2_chunks(model: str, chunk: str):
+                await job_manager.update_stage2_stream(job_id, model, content_chunk=chunk)
+            
+            stage2_batcher = ChunkBatcher(apply_stage2_chunks, batch_interval)
             
             async def on_stage2_chunk(model: str, chunk: str):
                 """Called for each chunk of text from a model during Stage 2."""
-                await job_manager.update_stage2_stream(job_id, model, content_chunk=chunk)
+                await stage2_batcher.add(model, chunk)
             
             async def on_stage2_model_complete(model: str, success: bool):
                 """Called when each model finishes Stage 2."""
+                await stage2_batcher.flush(model)
                 if success:
                     logger.info(f"[Job {job_id[:8]}] ✓ Stage 2: {model} complete")
                     await job_manager.update_stage2_stream(job_id, model, status='complete')
@@ -313,27 +573,28 @@ async def run_council_job(job_id: str, conversation_id: str, user_query: str, is
                     logger.warning(f"[Job {job_id[:8]}] ✗ Stage 2: {model} failed")
                     await job_manager.update_stage2_stream(job_id, model, status='failed')
             
-            stage2_results, label_to_model = await stage2_collect_rankings_streaming(
+            stage2_results, label_to_model = await _run_stage(2, stage2_collect_rankings_streaming(
                 user_query, 
                 stage1_results,
                 on_stage2_chunk,
-                on_stage2_model_complete
-            )
+                on_stage2_model_complete,
+                models=models
+            ), config.STAGE2_TIMEOUT_SECONDS)
+            await stage2_batcher.close()
             aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
             logger.info(f"[Job {job_id[:8]}] ✓ STAGE 2 COMPLETE: Got {len(stage2_results)} rankings")
             metadata = {
                 'label_to_model': label_to_model,
                 'aggregate_rankings': aggregate_rankings
             }
-            await job_manager.update_job_status(
-                job_id, 
-                JobStatus.STAGE2_COMPLETE, 
+            # Save stage 2 results right away to prevent data loss
+            await _commit_stage(
+                job_id,
+                conversation_id,
+                JobStatus.STAGE2_COMPLETE,
                 stage2=stage2_results,
                 metadata=metadata
             )
-            
-            # Save stage 2 results immediately to prevent data loss
-            storage.save_partial_assistant_message(conversation_id, stage2=stage2_results, metadata=metadata)
         else:
             logger.info(f"[Job {job_id[:8]}] → Skipping Stage 2 (only {len(stage1_results)} response, nothing to rank)")
             stage2_results = []
@@ -342,10 +603,8 @@ async def run_council_job(job_id: str, conversation_id: str, user_query: str, is
                 'aggregate_rankings': [],
                 'skipped_reason': 'insufficient_responses_for_ranking'
             }
-            await job_manager.update_job_status(job_id, JobStatus.STAGE2_COMPLETE, stage2=[], metadata=metadata)
-            
             # Save empty stage 2 with metadata
-            storage.save_partial_assistant_message(conversation_id, stage2=[], metadata=metadata)
+            await _commit_stage(job_id, conversation_id, JobStatus.STAGE2_COMPLETE, stage2=[], metadata=metadata)
 
         # Stage 3: Synthesize final answer with streaming
         logger.info(f"[Job {job_id[:8]}] ▶ STAGE 3: Synthesizing final answer (streaming)...")
@@ -355,12 +614,18 @@ async def run_council_job(job_id: str, conversation_id: str, user_query: str, is
         chairman = config.get_chairman_model()
         await job_manager.update_stage3_stream(job_id, model=chairman, status='streaming')
         
+        async def apply_stage3_chunks(model: str, chunk: str):
+            await job_manager.update_stage3_stream(job_id, content_chunk=chunk)
+        
+        stage3_batcher = ChunkBatcher(apply_stage3_chunks, batch_interval)
+        
         async def on_stage3_chunk(chunk: str):
             """Called for each chunk of text from the chairman."""
-            await job_manager.update_stage3_stream(job_id, content_chunk=chunk)
+            await stage3_batcher.add(chairman, chunk)
         
         async def on_stage3_complete(success: bool):
             """Called when the chairman finishes."""
+            await stage3_batcher.flush(chairman)
             if success:
                 logger.info(f"[Job {job_id[:8]}] ✓ Stage 3: Chairman complete")
                 await job_manager.update_stage3_stream(job_id, status='complete')
@@ -368,27 +633,18 @@ async def run_council_job(job_id: str, conversation_id: str, user_query: str, is
                 logger.warning(f"[Job {job_id[:8]}] ✗ Stage 3: Chairman failed")
                 await job_manager.update_stage3_stream(job_id, status='failed')
         
-        stage3_result = await stage3_synthesize_final_streaming(
+        stage3_result = await _run_stage(3, stage3_synthesize_final_streaming(
             user_query, 
             stage1_results, 
             stage2_results,
             on_stage3_chunk,
-            on_stage3_complete
-        )
+            on_stage3_complete,
+            chairman_model=chairman
+        ), config.STAGE3_TIMEOUT_SECONDS)
+        await stage3_batcher.close()
         logger.info(f"[Job {job_id[:8]}] ✓ STAGE 3 COMPLETE: Final response from {stage3_result.get('model', 'unknown')}")
-        await job_manager.update_job_status(job_id, JobStatus.COMPLETE, stage3=stage3_result)
-        
         # Save stage 3 results - this also marks the message as complete (removes _partial flag)
-        storage.save_partial_assistant_message(conversation_id, stage3=stage3_result)
-
-        # Wait for title generation if it was started (non-critical, wrapped in try/except)
-        if title_task:
-            try:
-                title = await title_task
-                logger.debug(f"[Job {job_id[:8]}] Title generated: {title}")
-                storage.update_conversation_title(conversation_id, title)
-            except Exception as title_error:
-                logger.warning(f"[Job {job_id[:8]}] Title generation failed (non-critical): {title_error}")
+        await _commit_stage(job_id, conversation_id, JobStatus.COMPLETE, stage3=stage3_result)
 
         # Mark job as complete and clean up temporary state
         await job_manager.complete_job(job_id)
@@ -396,40 +652,30 @@ async def run_council_job(job_id: str, conversation_id: str, user_query: str, is
         logger.info(f"[Job {job_id[:8]}] ✓✓✓ JOB COMPLETE ✓✓✓")
 
     except Exception as e:
-        logger.error(f"[Job {job_id[:8]}] ✗ JOB FAILED: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"[Job {job_id[:8]}] ✗ JOB FAILED: {str(e)}")
         await job_manager.fail_job(job_id, str(e))
         await job_manager.cleanup_job_state(job_id)
 
 
 @app.post("/api/conversations/{conversation_id}/message/stream")
-async def send_message_stream(conversation_id: str, request: SendMessageRequest):
+async def send_message_stream(conversation_id: str, request: SendMessageRequest, http_request: Request):
     """
     Send a message and start the council process as a background job.
     Returns the job ID immediately, then streams status updates.
-    The job continues running even if the client disconnects.
+    The job continues running even if the client disconnects, unless
+    CANCEL_ON_DISCONNECT is set.
     """
     logger.info(f"=" * 60)
     logger.info(f"NEW MESSAGE REQUEST for conversation {conversation_id[:8]}...")
     logger.info(f"User query: {request.content[:100]}{'...' if len(request.content) > 100 else ''}")
     
-    # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
-    if conversation is None:
-        logger.error(f"Conversation {conversation_id} not found!")
-        raise HTTPException(status_code=404, detail="Conversation not found")
-
     # Check if there's already a running job for this conversation
     if await job_manager.is_job_running(conversation_id):
         logger.warning(f"Job already running for conversation {conversation_id[:8]}")
         raise HTTPException(status_code=409, detail="A council process is already running for this conversation")
 
-    # Check if this is the first message
-    is_first_message = len(conversation["messages"]) == 0
-
     # Add user message immediately
-    storage.add_user_message(conversation_id, request.content)
+    await _prepare_message(conversation_id, request.content)
 
     # Create a job
     job_id = await job_manager.create_job(conversation_id, request.content)
@@ -438,7 +684,7 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     # Start the council process as a background task
     logger.info(f"Starting council background task...")
     task = asyncio.create_task(
-        run_council_job(job_id, conversation_id, request.content, is_first_message)
+        run_council_job(job_id, conversation_id, request.content)
     )
     await job_manager.set_job_task(job_id, task)
     logger.info(f"Background task started successfully")
@@ -450,41 +696,114 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
         """
         logger.info(f"[Stream {job_id[:8]}] Event generator started")
         last_status = None
-        poll_count = 0
+        last_progress_version = None
+        last_frame_at = 0.0
+        stream_sent = {}  # Stage 1/2: model -> characters (from the start of its stream) the client already has
+        last_shape = None
+        stage3_sent = 0  # Stage 3 characters (counted from the start of the stream) the client already has
+        wake_count = 0
+        loop = asyncio.get_running_loop()
         
         try:
             # Send initial job info
             logger.info(f"[Stream {job_id[:8]}] Sending job_started event")
-            yield f"data: {json.dumps({'type': 'job_started', 'job_id': job_id})}\n\n"
+            yield _sse({'type': 'job_started', 'job_id': job_id})
             
             while True:
-                poll_count += 1
+                # Stop streaming to a client that went away (and the job too, if configured)
+                if await http_request.is_disconnected():
+                    logger.info(f"[Stream {job_id[:8]}] Client disconnected")
+                    if config.CANCEL_ON_DISCONNECT:
+                        await job_manager.cancel_job(job_id)
+                    break
+                
+                wake_count += 1
+                # Taken before the read, so a change made while this frame is sent isn't missed
+                version = job_manager.get_version(job_id)
                 job = await job_manager.get_job(job_id)
                 if not job:
-                    logger.error(f"[Stream {job_id[:8]}] Job not found after {poll_count} polls!")
-                    yield f"data: {json.dumps({'type': 'error', 'message': 'Job not found'})}\n\n"
+                    logger.error(f"[Stream {job_id[:8]}] Job not found after {wake_count} wakeups!")
+                    yield _sse({'type': 'error', 'message': 'Job not found'})
                     break
                 
                 current_status = job["status"]
                 
-                # Log every 50 polls to show we're still alive
-                if poll_count % 50 == 0:
-                    logger.debug(f"[Stream {job_id[:8]}] Poll #{poll_count}, status: {current_status}")
+                # Only stream content changed: let a burst of chunks land in one frame,
+                # but a stage change ends the wait so it goes out straight away
+                if current_status == last_status:
+                    delay = last_frame_at + STREAM_FRAME_INTERVAL - loop.time()
+                    if delay > 0:
+                        while delay > 0 and job_manager.get_status(job_id) == current_status:
+                            version = await job_manager.wait_for_change(job_id, version, delay)
+                            delay = last_frame_at + STREAM_FRAME_INTERVAL - loop.time()
+                        continue
+                last_frame_at = loop.time()
                 
-                # Send progress updates during stage1 (every poll)
-                if current_status == JobStatus.STAGE1_RUNNING:
-                    progress = job.get("progress", {})
-                    yield f"data: {json.dumps({'type': 'stage1_progress', 'progress': progress})}\n\n"
+                # Progress frames only go out when progress changed (or a new stage began)
+                progress_version = job_manager.get_progress_version(job_id)
+                send_progress = progress_version != last_progress_version or current_status != last_status
+                last_progress_version = progress_version
+                
+                # Log every 50 wakeups to show we're still alive
+                if wake_count % 50 == 0:
+                    logger.debug("[Stream %s] Wakeup #%d, status: %s", job_id[:8], wake_count, current_status)
                 
-                # Send progress updates during stage2 (every poll)
-                if current_status == JobStatus.STAGE2_RUNNING:
+                # Send progress updates during stages 1 and 2 (on every change): the full
+                # progress when more than streamed text changed, else only each model's new text
+                if send_progress and current_status in _PARALLEL_STREAM_STAGES:
+                    stage_name, streams_key = _PARALLEL_STREAM_STAGES[current_status]
                     progress = job.get("progress", {})
-                    yield f"data: {json.dumps({'type': 'stage2_progress', 'progress': progress})}\n\n"
+                    streams = progress.get(streams_key, {})
+                    shape = _progress_shape(progress, streams_key)
+                    # Content only keeps the tail of long streams: it starts truncated_chars
+                    # into the stream, so offsets are kept in absolute characters. If text a
+                    # client hasn't seen was already dropped, resend what is kept.
+                    if (
+                        current_status != last_status
+                        or shape != last_shape
+                        or any(stream_sent.get(model, 0) < s.get("truncated_chars", 0) for model, s in streams.items())
+                    ):
+                        yield _sse({'type': f'{stage_name}_progress', 'progress': progress})
+                        last_shape = shape
+                        stream_sent = {
+                            model: s.get("truncated_chars", 0) + len(s.get("content", ""))
+                            for model, s in streams.items()
+                        }
+                    else:
+                        frames = []
+                        for model, stream in streams.items():
+                            content = stream.get("content", "")
+                            truncated = stream.get("truncated_chars", 0)
+                            sent = stream_sent.get(model, 0)
+                            if truncated + len(content) > sent:
+                                # Only the new text needs encoding; the rest of the frame is cached
+                                prefix = _chunk_frame_prefix(f'{stage_name}_chunk', model)
+                                frames.append(prefix + jsonutil.dumps(content[sent - truncated:]) + b'}\n\n')
+                                stream_sent[model] = truncated + len(content)
+                        if frames:
+                            yield b"".join(frames)
                 
-                # Send progress updates during stage3 (every poll)
-                if current_status == JobStatus.STAGE3_RUNNING:
+                # Send progress updates during stage3 (on every change): the full
+                # progress once, then only the synthesis text added since the last frame
+                if send_progress and current_status == JobStatus.STAGE3_RUNNING:
                     progress = job.get("progress", {})
-                    yield f"data: {json.dumps({'type': 'stage3_progress', 'progress': progress})}\n\n"
+                    stream = progress.get("stage3_stream", {})
+                    content = stream.get("content", "")
+                    # Content only keeps the tail of long streams: it starts truncated_chars
+                    # into the stream, so offsets are kept in absolute characters
+                    truncated = stream.get("truncated_chars", 0)
+                    # If text the client hasn't seen was already dropped, resend what is kept
+                    if current_status != last_status or stage3_sent < truncated:
+                        yield _sse({'type': 'stage3_progress', 'progress': progress})
+                    else:
+                        yield _sse({
+                            'type': 'stage3_chunk',
+                            'content': content[stage3_sent - truncated:],
+                            'status': stream.get("status"),
+                            'char_count': stream.get("char_count", 0),
+                            'model': stream.get("model", ""),
+                        })
+                    stage3_sent = truncated + len(content)
                 
                 # Send status change events
                 if current_status != last_status:
@@ -492,50 +811,49 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                     last_status = current_status
                     
                     if current_status == JobStatus.STAGE1_RUNNING:
-                        yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
+                        yield _STAGE1_START_FRAME
                     
                     elif current_status == JobStatus.STAGE1_COMPLETE:
                         logger.info(f"[Stream {job_id[:8]}] Sending stage1_complete with {len(job['stage1'])} responses")
-                        yield f"data: {json.dumps({'type': 'stage1_complete', 'data': job['stage1']})}\n\n"
+                        yield _sse({'type': 'stage1_complete', 'data': job['stage1']})
                     
                     elif current_status == JobStatus.STAGE2_RUNNING:
-                        yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
+                        yield _STAGE2_START_FRAME
                     
                     elif current_status == JobStatus.STAGE2_COMPLETE:
                         logger.info(f"[Stream {job_id[:8]}] Sending stage2_complete with {len(job['stage2'])} rankings")
-                        yield f"data: {json.dumps({'type': 'stage2_complete', 'data': job['stage2'], 'metadata': job['metadata']})}\n\n"
+                        yield _sse({'type': 'stage2_complete', 'data': job['stage2'], 'metadata': job['metadata']})
                     
                     elif current_status == JobStatus.STAGE3_RUNNING:
-                        yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
+                        yield _STAGE3_START_FRAME
                     
                     elif current_status == JobStatus.COMPLETE:
                         logger.info(f"[Stream {job_id[:8]}] Sending stage3_complete and complete events")
-                        yield f"data: {json.dumps({'type': 'stage3_complete', 'data': job['stage3']})}\n\n"
-                        yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+                        yield _sse({'type': 'stage3_complete', 'data': job['stage3']})
+                        yield _COMPLETE_FRAME
                         break
                     
                     elif current_status == JobStatus.ERROR:
                         logger.error(f"[Stream {job_id[:8]}] Job error: {job['error']}")
-                        yield f"data: {json.dumps({'type': 'error', 'message': job['error']})}\n\n"
+                        yield _sse({'type': 'error', 'message': job['error']})
                         break
                 
-                # Poll every 100ms
-                await asyncio.sleep(0.1)
+                # Sleep until the job changes, instead of polling
+                while await job_manager.wait_for_change(job_id, version, STREAM_KEEPALIVE_SECONDS) == version:
+                    if await http_request.is_disconnected():
+                        break
+                    # Idle: an SSE comment keeps proxies from dropping the connection
+                    yield _KEEPALIVE_FRAME
         except Exception as e:
-            logger.error(f"[Stream {job_id[:8]}] Generator exception: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            logger.exception(f"[Stream {job_id[:8]}] Generator exception: {e}")
+            yield _sse({'type': 'error', 'message': str(e)})
         finally:
-            logger.info(f"[Stream {job_id[:8]}] Event generator finished after {poll_count} polls")
+            logger.info(f"[Stream {job_id[:8]}] Event generator finished after {wake_count} wakeups")
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
+        headers=_SSE_HEADERS
     )
 
 
@@ -546,7 +864,7 @@ async def get_conversation_job(conversation_id: str):
     Used by the frontend to restore state after page refresh.
     """
     # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
+    conversation = await storage.conversation_writer.read(conversation_id, storage.get_conversation, conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
@@ -554,10 +872,10 @@ async def get_conversation_job(conversation_id: str):
     if not job:
         return {"has_job": False}
     
-    return {
+    return _json_response({
         "has_job": True,
         "job": job
-    }
+    })
 
 
 @app.get("/api/jobs/{job_id}")
@@ -568,41 +886,95 @@ async def get_job(job_id: str):
     job = await job_manager.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    return _json_response(job)
 
 
-@app.get("/api/openrouter/models")
-async def get_openrouter_models():
-    """
-    Fetch available models from OpenRouter API.
-    Filters out non-chat models (image, audio, embedding, etc.).
-    """
-    all_models = await fetch_available_models()
+MODELS_CACHE_TTL_SECONDS = 300  # The OpenRouter catalog changes rarely
+
+# Model ID keywords of non-chat models (image, audio, embedding, moderation, tts, whisper)
+_NON_CHAT_MODEL_KEYWORDS = ('dall-e', 'image', 'vision', 'audio', 'whisper', 'tts', 'embed', 'moderation', 'realtime')
+# All keywords matched in a single scan of each ID
+_NON_CHAT_MODEL_RE = re.compile("|".join(map(re.escape, _NON_CHAT_MODEL_KEYWORDS)), re.IGNORECASE)
+
+# Served when the model list can't be fetched and there is nothing cached to fall back on
+_EMPTY_MODELS_BODY = jsonutil.dumps({'models': []})
+
+# (time cached, encoded response body) of the last filtered model list
+_models_cache: Optional[tuple] = None
+
+# Fetch in progress, shared by concurrent requests that miss the cache
+_models_inflight: Optional[asyncio.Task] = None
+
+
+async def _load_models_body() -> bytes:
+    """Fetch, filter and encode the model list, caching it on success."""
+    global _models_cache
     
-    # Filter for chat/text models only (exclude image, audio, embedding, etc.)
-    filtered_models = []
-    for model in all_models:
-        model_id = model.get('id', '')
-        # Skip non-chat models (image, audio, embedding, moderation, tts, whisper)
-        model_id_lower = model_id.lower()
-        if any(skip in model_id_lower for skip in [
-            'dall-e', 'image', 'vision', 'audio', 'whisper', 'tts', 
-            'embedding', 'embed', 'moderation', 'realtime'
-        ]):
-            continue
-        
-        # Extract provider from model ID
-        provider = model_id.split('/')[0] if '/' in model_id else 'unknown'
-        filtered_models.append({
+    # Filter for chat/text models only (exclude image, audio, embedding, etc.), in one pass
+    filtered_models = [
+        {
             'id': model_id,
             'name': model.get('name', model_id),
-            'provider': provider,
+            # Provider is the model ID's prefix
+            'provider': model_id.partition('/')[0] if '/' in model_id else 'unknown',
             'context_length': model.get('context_length', 0),
             'pricing': model.get('pricing', {}),
             'description': model.get('description', '')
-        })
+        }
+        for model in await fetch_available_models()
+        if not _NON_CHAT_MODEL_RE.search(model_id := model.get('id', ''))
+    ]
     
-    return {'models': filtered_models}
+    body = jsonutil.dumps({'models': filtered_models})
+    # An empty list means the fetch failed, so try again on the next request
+    if filtered_models:
+        _models_cache = (time.monotonic(), body)
+    return body
+
+
+@app.get("/api/openrouter/models")
+async def get_openrouter_models():
+    """
+    Fetch available models from OpenRouter API.
+    Filters out non-chat models (image, audio, embedding, etc.).
+    The filtered list is cached for MODELS_CACHE_TTL_SECONDS, here and in the browser.
+    """
+    global _models_inflight
+    if _models_cache is None or time.monotonic() - _models_cache[0] >= MODELS_CACHE_TTL_SECONDS:
+        stale = _models_cache
+        # Concurrent misses share one upstream fetch
+        if _models_inflight is None:
+            _models_inflight = asyncio.create_task(_load_models_body())
+            _models_inflight.add_done_callback(_clear_models_inflight)
+        try:
+            # Shielded so one client going away doesn't cancel the fetch for the others
+            body = await asyncio.shield(_models_inflight)
+        except Exception as e:
+            logger.error(f"Failed to refresh the OpenRouter model list: {e!r}")
+            body = None
+        if _models_cache is None or _models_cache[1] is not body:
+            # A failed refresh falls back to the last good list; either way it isn't
+            # cached, so the browser shouldn't cache it either
+            if stale is not None:
+                body = stale[1]
+            elif body is None:
+                body = _EMPTY_MODELS_BODY
+            return Response(content=body, media_type="application/json", headers={"Cache-Control": "no-store"})
+    
+    cached_at, body = _models_cache
+    max_age = max(0, int(cached_at + MODELS_CACHE_TTL_SECONDS - time.monotonic()))
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": f"private, max-age={max_age}"}
+    )
+
+
+def _clear_models_inflight(task: asyncio.Task):
+    """Forget a finished shared model fetch."""
+    global _models_inflight
+    if _models_inflight is task:
+        _models_inflight = None
 
 
 @app.get("/api/council/config")
@@ -624,12 +996,15 @@ async def update_council_config(request: UpdateCouncilConfigRequest):
     if not request.chairman_model:
         raise HTTPException(status_code=400, detail="Chairman model is required")
     
-    # Save to persistent storage
-    config.save_council_config(request.council_models, request.chairman_model)
-    
-    # Also update the module-level variables for backward compatibility
-    config.COUNCIL_MODELS = request.council_models
-    config.CHAIRMAN_MODEL = request.chairman_model
+    # Only write when something changed (the UI may re-send the same config)
+    current = (config.get_council_models(), config.get_chairman_model())
+    if (request.council_models, request.chairman_model) != current:
+        # Save to persistent storage
+        await asyncio.to_thread(config.save_council_config, request.council_models, request.chairman_model)
+        
+        # Also update the module-level variables for backward compatibility
+        config.COUNCIL_MODELS = request.council_models
+        config.CHAIRMAN_MODEL = request.chairman_model
     
     return {
         'council_models': request.council_models,
@@ -637,15 +1012,19 @@ async def update_council_config(request: UpdateCouncilConfigRequest):
     }
 
 
+# The roles are fixed, so the response body is encoded once
+_DEBATE_ROLES_BODY = jsonutil.dumps({
+    'roles': [
+        {'key': key, **value}
+        for key, value in DEBATE_ROLES.items()
+    ]
+})
+
+
 @app.get("/api/debate/roles")
 async def get_debate_roles():
     """Get available debate roles."""
-    return {
-        'roles': [
-            {'key': key, **value}
-            for key, value in DEBATE_ROLES.items()
-        ]
-    }
+    return Response(content=_DEBATE_ROLES_BODY, media_type="application/json")
 
 
 @app.post("/api/debate/start")
@@ -677,20 +1056,34 @@ async def start_debate(request: StartDebateRequest):
                 max_turns=request.max_turns,
                 roles=request.roles
             ):
-                yield f"data: {json.dumps(event)}\n\n"
+                yield _sse(event)
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield _sse({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
+        headers=_SSE_HEADERS
     )
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+
+    # uvloop ships with uvicorn[standard] but is unavailable on Windows
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    # httptools (also from uvicorn[standard]) is a C HTTP parser, faster than h11
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+
+    # A single worker: jobs live in this process's memory, so the streams that
+    # follow a job must be served by the process that runs it
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop=loop, http=http)
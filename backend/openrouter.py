@@ -1,95 +1,247 @@
 """OpenRouter API client for making LLM requests."""
 
+import asyncio
 import logging
 import httpx
-from typing import List, Dict, Any, Optional
-from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
+from typing import List, Dict, Any, Optional, Callable, Awaitable, AsyncIterator, Tuple
+from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL, OPENROUTER_MODELS_URL, LLM_MAX_CONCURRENCY
+from . import jsonutil
 
 logger = logging.getLogger('council.openrouter')
 
+# HTTP/2 lets parallel council requests share one connection; it needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Request headers are built once; httpx merges them into each request without mutating them
+# (it already sends Accept-Encoding for every compression it can decode)
+_HEADERS = {
+    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+    "Content-Type": "application/json",
+}
+_GET_HEADERS = {"Authorization": _HEADERS["Authorization"]}
+
+# Caps model requests across all callers, so concurrent jobs can't set off rate limiting
+_LLM_SEM = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+# Shared client so TCP/TLS connections to OpenRouter are pooled across all calls
+KEEPALIVE_EXPIRY_SECONDS = 90.0  # How long an idle pooled connection is kept open
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            # No read timeout - only connect timeout to detect unreachable servers
+            timeout=httpx.Timeout(None, connect=60.0),
+            # httpx drops idle connections after 5s by default, which would throw away
+            # the warmed-up pool between one council request and the next
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=64,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=_HTTP2_AVAILABLE,
+        )
+    return _CLIENT
+
+
+async def warm_up_connections(count: int = 1):
+    """
+    Open connections to OpenRouter ahead of the first council request.
+    Issues `count` concurrent HEAD requests so the pool holds that many
+    established TLS connections (one is enough when HTTP/2 is active).
+
+    Args:
+        count: Number of connections to prime (typically the council size)
+    """
+    client = _get_client()
+    count = 1 if _HTTP2_AVAILABLE else max(1, count)
+
+    async def _head():
+        try:
+            await client.head(OPENROUTER_MODELS_URL, timeout=10.0)
+        except httpx.HTTPError as e:
+            logger.debug("Connection warm-up failed: %s: %s", type(e).__name__, e)
+
+    await asyncio.gather(*(_head() for _ in range(count)))
+    if _HTTP2_AVAILABLE:
+        logger.info("Pre-warmed %d connection(s) to OpenRouter (HTTP/2)", count)
+    else:
+        logger.info(
+            "Pre-warmed %d connection(s) to OpenRouter "
+            "(HTTP/1.1; install httpx[http2] to multiplex requests over one connection)",
+            count,
+        )
+
+
+async def close_client():
+    """Close the shared AsyncClient (called on app shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+def _error_excerpt(response: httpx.Response, limit: int) -> str:
+    """Decode only the first `limit` bytes of an error body, which may be a large HTML page."""
+    return response.content[:limit].decode('utf-8', errors='replace')
+
 
 async def query_model(
     model: str,
     messages: List[Dict[str, str]],
+    timeout: Optional[float] = None,
+    max_tokens: Optional[int] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Query a single model via OpenRouter API.
-    No timeout - let the model respond as long as it needs.
+    No timeout by default - let the model respond as long as it needs.
 
     Args:
         model: OpenRouter model identifier (e.g., "openai/gpt-4o")
         messages: List of message dicts with 'role' and 'content'
+        timeout: Optional read/write timeout in seconds for this request
+        max_tokens: Optional cap on the response length
 
     Returns:
         Response dict with 'content' and optional 'reasoning_details', or None if failed
     """
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-    }
+    return await query_model_prebuilt(model, jsonutil.dumps(messages), timeout, max_tokens)
+
 
-    payload = {
-        "model": model,
-        "messages": messages,
-    }
+async def query_model_prebuilt(
+    model: str,
+    messages_json: bytes,
+    timeout: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Query a single model using messages that are already JSON-encoded.
+    Lets callers sending the same messages to several models encode them once.
+
+    Args:
+        model: OpenRouter model identifier
+        messages_json: JSON-encoded list of message dicts (see jsonutil.dumps)
+        timeout: Optional read/write timeout in seconds for this request
+        max_tokens: Optional cap on the response length
+
+    Returns:
+        Response dict with 'content' and optional 'reasoning_details', or None if failed
+    """
+    # Splice the model into the pre-encoded body instead of re-encoding the messages
+    body = b'{"model":' + jsonutil.dumps(model) + b',"messages":' + messages_json
+    if max_tokens is not None:
+        body += b',"max_tokens":' + jsonutil.dumps(max_tokens)
+    body += b'}'
 
     try:
-        logger.info(f"  → Calling {model}...")
-        # No read timeout - only connect timeout to detect unreachable servers
-        timeout_config = httpx.Timeout(None, connect=60.0)
-        async with httpx.AsyncClient(timeout=timeout_config) as client:
-            response = await client.post(
+        logger.info("  → Calling %s...", model)
+        async with _LLM_SEM:
+            response = await _get_client().post(
                 OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
+                headers=_HEADERS,
+                content=body,
+                timeout=httpx.Timeout(timeout, connect=60.0) if timeout is not None else httpx.USE_CLIENT_DEFAULT
             )
-            response.raise_for_status()
+        # Confirms whether requests are actually multiplexed over HTTP/2
+        logger.debug("  %s served over %s", model, response.http_version)
+        response.raise_for_status()
 
-            data = response.json()
-            
-            # Log the raw response structure for debugging
-            if 'choices' not in data:
-                logger.error(f"  ✗ {model} - No 'choices' in response: {str(data)[:500]}")
-                return None
-            
-            if len(data['choices']) == 0:
-                logger.error(f"  ✗ {model} - Empty 'choices' array")
-                return None
-                
-            message = data['choices'][0].get('message')
-            if not message:
-                logger.error(f"  ✗ {model} - No 'message' in choice: {str(data['choices'][0])[:500]}")
-                return None
+        data = jsonutil.loads(response.content)
+        
+        # Log the raw response structure for debugging
+        if 'choices' not in data:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("  ✗ %s - No 'choices' in response: %s", model, str(data)[:500])
+            return None
+        
+        if len(data['choices']) == 0:
+            logger.error("  ✗ %s - Empty 'choices' array", model)
+            return None
             
-            content = message.get('content', '')
-            logger.info(f"  ← {model} responded ({len(content)} chars)")
+        message = data['choices'][0].get('message')
+        if not message:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("  ✗ %s - No 'message' in choice: %s", model, str(data['choices'][0])[:500])
+            return None
+        
+        content = message.get('content', '')
+        logger.info("  ← %s responded (%d chars)", model, len(content))
 
-            return {
-                'content': content,
-                'reasoning_details': message.get('reasoning_details')
-            }
+        return {
+            'content': content,
+            'reasoning_details': message.get('reasoning_details')
+        }
 
+    except httpx.ConnectTimeout:
+        logger.error("  ✗ %s CONNECTION TIMEOUT (server unreachable)", model)
+        return None
     except httpx.TimeoutException:
-        logger.error(f"  ✗ {model} CONNECTION TIMEOUT (server unreachable)")
+        logger.error("  ✗ %s TIMEOUT (no response within %ss)", model, timeout)
         return None
     except httpx.HTTPStatusError as e:
-        logger.error(f"  ✗ {model} HTTP ERROR: {e.response.status_code} - {e.response.text[:500]}")
+        logger.error("  ✗ %s HTTP ERROR: %d - %s", model, e.response.status_code, _error_excerpt(e.response, 500))
         return None
     except KeyError as e:
-        logger.error(f"  ✗ {model} KEY ERROR: Missing key {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("  ✗ %s KEY ERROR: Missing key %s", model, e)
         return None
     except Exception as e:
-        logger.error(f"  ✗ {model} ERROR: {type(e).__name__}: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("  ✗ %s ERROR: %s: %s", model, type(e).__name__, e)
         return None
 
 
+async def iter_models_parallel(
+    models: List[str],
+    messages: List[Dict[str, str]],
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Query multiple models in parallel, yielding each response as soon as it arrives.
+    No timeout - let models respond as long as needed. Closing the iterator early
+    cancels the queries still running.
+
+    Args:
+        models: List of OpenRouter model identifiers
+        messages: List of message dicts to send to each model
+        semaphore: Optional semaphore bounding how many requests run at once
+
+    Yields:
+        Tuples of (model, response dict or None if failed), in completion order
+    """
+    # Every model gets the same messages, so encode them once for all requests
+    messages_json = jsonutil.dumps(messages)
+
+    async def run_query(model: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        try:
+            if semaphore is None:
+                return model, await query_model_prebuilt(model, messages_json)
+            async with semaphore:
+                return model, await query_model_prebuilt(model, messages_json)
+        except Exception as e:
+            logger.error("  ✗ %s EXCEPTION: %s: %s", model, type(e).__name__, e)
+            return model, None
+
+    # Create tasks for all models - no timeout wrapper
+    tasks = [asyncio.create_task(run_query(model)) for model in models]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 async def query_models_parallel(
     models: List[str],
     messages: List[Dict[str, str]],
+    semaphore: Optional[asyncio.Semaphore] = None,
+    on_result: Optional[Callable[[str, Optional[Dict[str, Any]]], None]] = None,
 ) -> Dict[str, Optional[Dict[str, Any]]]:
     """
     Query multiple models in parallel. No timeout - let models respond as long as needed.
@@ -97,41 +249,54 @@ async def query_models_parallel(
     Args:
         models: List of OpenRouter model identifiers
         messages: List of message dicts to send to each model
+        semaphore: Optional semaphore bounding how many requests run at once
+        on_result: Optional callback(model, response) called as each model finishes
 
     Returns:
         Dict mapping model identifier to response dict (or None if failed)
     """
-    import asyncio
+    logger.info("Querying %d models in parallel: %s", len(models), models)
 
-    logger.info(f"Querying {len(models)} models in parallel: {models}")
-    
-    # Create tasks for all models - no timeout wrapper
-    tasks = [query_model(model, messages) for model in models]
+    responses = {}
+    success_count = 0
+    async for model, response in iter_models_parallel(models, messages, semaphore):
+        if response is not None:
+            success_count += 1
+            logger.info("  ✓ %s finished (%d/%d so far)", model, success_count, len(models))
+        if on_result is not None:
+            on_result(model, response)
+        responses[model] = response
+
+    logger.info("Parallel query complete: %d/%d succeeded", success_count, len(models))
+    # Map models to their responses, in the order they were given
+    return {model: responses[model] for model in models}
 
-    # Wait for all to complete
-    responses = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    # Handle any exceptions that slipped through
-    processed_responses = []
-    for i, resp in enumerate(responses):
-        if isinstance(resp, Exception):
-            logger.error(f"  ✗ {models[i]} EXCEPTION: {type(resp).__name__}: {resp}")
-            processed_responses.append(None)
-        else:
-            processed_responses.append(resp)
 
-    # Count successes/failures
-    success_count = sum(1 for r in processed_responses if r is not None)
-    logger.info(f"Parallel query complete: {success_count}/{len(models)} succeeded")
+MAX_SSE_LINE_BYTES = 1 << 20  # Longest streamed line accepted before the stream is dropped
 
-    # Map models to their responses
-    return {model: response for model, response in zip(models, processed_responses)}
+
+def _take_lines(buffer: bytearray) -> List[bytes]:
+    """
+    Remove the complete lines from the start of a stream buffer.
+
+    Args:
+        buffer: Bytes received so far; a trailing partial line is left in it
+
+    Returns:
+        The complete lines, without their newlines
+    """
+    end = buffer.rfind(b'\n')
+    if end == -1:
+        return []
+    lines = bytes(buffer[:end]).split(b'\n')
+    del buffer[:end + 1]
+    return lines
 
 
 async def stream_model(
     model: str,
     messages: List[Dict[str, str]],
-    on_chunk: callable,
+    on_chunk: Callable[[str], Awaitable[None]],
 ) -> Optional[Dict[str, Any]]:
     """
     Stream a response from a model, calling on_chunk for each text chunk.
@@ -145,76 +310,101 @@ async def stream_model(
     Returns:
         Final response dict with full 'content', or None if failed
     """
-    import json
-    
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    payload = {
-        "model": model,
-        "messages": messages,
-        "stream": True,
-    }
-
-    full_content = ""
+    return await stream_model_prebuilt(model, jsonutil.dumps(messages), on_chunk)
+
+
+async def stream_model_prebuilt(
+    model: str,
+    messages_json: bytes,
+    on_chunk: Callable[[str], Awaitable[None]],
+) -> Optional[Dict[str, Any]]:
+    """
+    Stream a response from a model using messages that are already JSON-encoded.
+    Lets callers that send the same prompt to many models encode it once.
+
+    Args:
+        model: OpenRouter model identifier
+        messages_json: JSON-encoded list of message dicts (see jsonutil.dumps)
+        on_chunk: Async callback(text_chunk) called for each chunk of text
+
+    Returns:
+        Final response dict with full 'content', or None if failed
+    """
+    # Splice the model into the pre-encoded body instead of re-encoding the messages
+    body = b'{"model":' + jsonutil.dumps(model) + b',"messages":' + messages_json + b',"stream":true}'
+
+    parts: List[str] = []  # Joined once at the end, instead of growing a str per chunk
+    append_part = parts.append  # Bound once, outside the per-delta loop
     
     try:
-        logger.info(f"  → Streaming {model}...")
-        # No timeout - let models respond as long as they need
-        # Only set a connect timeout to detect if the server is unreachable
-        timeout_config = httpx.Timeout(None, connect=60.0)
-        
-        async with httpx.AsyncClient(timeout=timeout_config) as client:
-            async with client.stream(
-                "POST",
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            ) as response:
-                response.raise_for_status()
-                
-                async for line in response.aiter_lines():
-                    if not line:
+        logger.info("  → Streaming %s...", model)
+        async with _LLM_SEM, _get_client().stream(
+            "POST",
+            OPENROUTER_API_URL,
+            headers=_HEADERS,
+            content=body
+        ) as response:
+            if response.is_error:
+                # Read the error body while the stream is open so the handler can log it
+                await response.aread()
+            response.raise_for_status()
+            
+            # Lines are parsed as bytes; only the JSON payloads are ever decoded
+            buffer = bytearray()
+            done = False
+            # No chunk_size: httpcore already reads up to 64 KiB per call, and a fixed
+            # chunk_size would hold back deltas until that many bytes had arrived
+            async for raw in response.aiter_bytes():
+                buffer += raw
+                for line in _take_lines(buffer):
+                    # Only data lines matter; this skips blank lines and SSE comments
+                    # (OpenRouter keepalive)
+                    if not line.startswith(b'data: '):
                         continue
+                    payload = line[6:]
+                    
+                    # Check for stream end
+                    if payload.strip() == b'[DONE]':
+                        done = True
+                        break
                     
-                    # Skip SSE comments (OpenRouter keepalive)
-                    if line.startswith(':'):
+                    # Events without a content key (usage, or reasoning on some providers)
+                    # can't produce text, so don't spend a JSON parse on them
+                    if b'"content"' not in payload:
                         continue
                     
-                    # Parse SSE data
-                    if line.startswith('data: '):
-                        data_str = line[6:]
-                        
-                        # Check for stream end
-                        if data_str.strip() == '[DONE]':
-                            break
-                        
-                        try:
-                            data = json.loads(data_str)
-                            delta = data.get('choices', [{}])[0].get('delta', {})
-                            content = delta.get('content', '')
-                            
-                            if content:
-                                full_content += content
-                                await on_chunk(content)
-                                
-                        except json.JSONDecodeError:
-                            # Ignore malformed chunks
-                            pass
+                    try:
+                        data = jsonutil.loads(payload)
+                        # Index directly: nearly every chunk has all the keys, so skip
+                        # building .get() defaults and only pay on the rare miss
+                        content = data['choices'][0]['delta']['content']
+                    except (jsonutil.JSONDecodeError, KeyError, IndexError, TypeError):
+                        # Ignore malformed chunks and ones without a content delta
+                        continue
+                    
+                    if content:
+                        append_part(content)
+                        await on_chunk(content)
+                if done:
+                    break
+                # Whatever is left is one unfinished line; a stream that never sends a
+                # newline would otherwise grow it without bound
+                if len(buffer) > MAX_SSE_LINE_BYTES:
+                    logger.error("  ✗ %s runaway SSE line (over %d bytes without a newline)", model, MAX_SSE_LINE_BYTES)
+                    return None
         
-        logger.info(f"  ← {model} streamed ({len(full_content)} chars)")
+        full_content = "".join(parts)
+        logger.info("  ← %s streamed (%d chars)", model, len(full_content))
         return {'content': full_content}
         
     except httpx.TimeoutException:
-        logger.error(f"  ✗ {model} CONNECTION TIMEOUT (server unreachable)")
+        logger.error("  ✗ %s CONNECTION TIMEOUT (server unreachable)", model)
         return None
     except httpx.HTTPStatusError as e:
-        logger.error(f"  ✗ {model} HTTP {e.response.status_code}: {e.response.text[:200]}")
+        logger.error("  ✗ %s HTTP %d: %s", model, e.response.status_code, _error_excerpt(e.response, 200))
         return None
     except Exception as e:
-        logger.error(f"  ✗ {model} ERROR: {type(e).__name__}: {e}")
+        logger.error("  ✗ %s ERROR: %s: %s", model, type(e).__name__, e)
         return None
 
 
@@ -225,20 +415,16 @@ async def fetch_available_models() -> List[Dict[str, Any]]:
     Returns:
         List of model dicts with id, name, pricing, context_length, etc.
     """
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-    }
-
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                "https://openrouter.ai/api/v1/models",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get('data', [])
+        response = await _get_client().get(
+            OPENROUTER_MODELS_URL,
+            headers=_GET_HEADERS,
+            timeout=30.0
+        )
+        response.raise_for_status()
+        data = jsonutil.loads(response.content)
+        return data.get('data', [])
 
     except Exception as e:
-        print(f"Error fetching models from OpenRouter: {e}")
+        logger.error("Error fetching models from OpenRouter: %s: %s", type(e).__name__, e)
         return []
@@ -1,11 +1,12 @@
 """JSON-based storage for conversations."""
 
-import json
+import asyncio
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 from .config import DATA_DIR
+from . import jsonutil
 
 
 def ensure_data_dir():
@@ -18,6 +19,14 @@ def get_conversation_path(conversation_id: str) -> str:
     return os.path.join(DATA_DIR, f"{conversation_id}.json")
 
 
+def _write_file(path: str, conversation: Dict[str, Any]):
+    """Write a conversation file atomically, so readers in other threads never see half of it."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(jsonutil.dumps_pretty(conversation))
+    os.replace(tmp_path, path)
+
+
 def create_conversation(conversation_id: str) -> Dict[str, Any]:
     """
     Create a new conversation.
@@ -38,9 +47,7 @@ def create_conversation(conversation_id: str) -> Dict[str, Any]:
     }
 
     # Save to file
-    path = get_conversation_path(conversation_id)
-    with open(path, 'w') as f:
-        json.dump(conversation, f, indent=2)
+    _write_file(get_conversation_path(conversation_id), conversation)
 
     return conversation
 
@@ -60,8 +67,8 @@ def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
     if not os.path.exists(path):
         return None
 
-    with open(path, 'r') as f:
-        return json.load(f)
+    with open(path, 'rb') as f:
+        return jsonutil.loads(f.read())
 
 
 def save_conversation(conversation: Dict[str, Any]):
@@ -73,9 +80,7 @@ def save_conversation(conversation: Dict[str, Any]):
     """
     ensure_data_dir()
 
-    path = get_conversation_path(conversation['id'])
-    with open(path, 'w') as f:
-        json.dump(conversation, f, indent=2)
+    _write_file(get_conversation_path(conversation['id']), conversation)
 
 
 def list_conversations() -> List[Dict[str, Any]]:
@@ -91,8 +96,8 @@ def list_conversations() -> List[Dict[str, Any]]:
     for filename in os.listdir(DATA_DIR):
         if filename.endswith('.json'):
             path = os.path.join(DATA_DIR, filename)
-            with open(path, 'r') as f:
-                data = json.load(f)
+            with open(path, 'rb') as f:
+                data = jsonutil.loads(f.read())
                 # Return metadata only
                 conversations.append({
                     "id": data["id"],
@@ -127,6 +132,32 @@ def add_user_message(conversation_id: str, content: str):
     save_conversation(conversation)
 
 
+def begin_message(conversation_id: str, content: str) -> Optional[Dict[str, Any]]:
+    """
+    Add a user message to a conversation with a single read and write of its file.
+
+    Args:
+        conversation_id: Conversation identifier
+        content: User message content
+
+    Returns:
+        Dict with 'is_first' (whether this is the conversation's first message) and
+        'conversation', or None if the conversation doesn't exist
+    """
+    conversation = get_conversation(conversation_id)
+    if conversation is None:
+        return None
+
+    is_first = len(conversation["messages"]) == 0
+    conversation["messages"].append({
+        "role": "user",
+        "content": content
+    })
+    save_conversation(conversation)
+
+    return {"is_first": is_first, "conversation": conversation}
+
+
 def add_assistant_message(
     conversation_id: str,
     stage1: List[Dict[str, Any]],
@@ -224,6 +255,9 @@ def save_partial_assistant_message(
             "stage3": stage3 or {},
             "_partial": True  # Mark as incomplete
         }
+        if stage3 is not None:
+            # Queued updates can arrive merged, with stage3 in the first save
+            message.pop("_partial")
         if metadata:
             message["metadata"] = metadata
         messages.append(message)
@@ -231,6 +265,117 @@ def save_partial_assistant_message(
     save_conversation(conversation)
 
 
+class ConversationWriter:
+    """
+    Write-behind queue for the updates a running council makes to its conversation.
+    Updates are applied in a worker thread so file writes never stall the event loop,
+    and updates queued for a conversation before the worker reaches it are merged
+    (latest value per field wins) into a single save.
+    Request handlers run their storage calls through read() and write(), which also
+    keep them off the event loop; writes are applied one at a time, so two
+    read-modify-write updates of a file can't interleave.
+    """
+
+    def __init__(self):
+        # conversation_id -> merged partial message fields (and "title")
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # Conversation being written right now, if any
+        self._writing: Optional[str] = None
+        # Set (and replaced) after every write, waking flush() callers
+        self._written = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        # Held around every write to a conversation file
+        self._write_lock = asyncio.Lock()
+
+    def save_partial(self, conversation_id: str, **fields):
+        """Queue a save_partial_assistant_message() call; None fields are left alone."""
+        pending = self._pending.setdefault(conversation_id, {})
+        pending.update((key, value) for key, value in fields.items() if value is not None)
+        self._start()
+
+    def update_title(self, conversation_id: str, title: str):
+        """Queue an update_conversation_title() call."""
+        self._pending.setdefault(conversation_id, {})["title"] = title
+        self._start()
+
+    async def flush(self, conversation_id: Optional[str] = None):
+        """
+        Wait until queued updates are on disk.
+
+        Args:
+            conversation_id: Only wait for this conversation's updates (default: all)
+        """
+        while (self._pending or self._writing) if conversation_id is None else (
+                conversation_id in self._pending or self._writing == conversation_id):
+            await self._written.wait()
+
+    async def read(self, conversation_id: Optional[str], fn: Callable, *args) -> Any:
+        """
+        Run a storage read in a worker thread, once queued updates are on disk.
+
+        Args:
+            conversation_id: Conversation whose updates to wait for (None = all)
+            fn: The storage function
+            *args: Its arguments
+
+        Returns:
+            What fn returns
+        """
+        await self.flush(conversation_id)
+        return await asyncio.to_thread(fn, *args)
+
+    async def write(self, fn: Callable, *args) -> Any:
+        """
+        Run a storage write in a worker thread, one at a time with the queued updates.
+
+        Args:
+            fn: The storage function
+            *args: Its arguments
+
+        Returns:
+            What fn returns
+        """
+        async with self._write_lock:
+            return await asyncio.to_thread(fn, *args)
+
+    def _start(self):
+        """Start the worker if it isn't running. Must be called from the event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        """Apply queued updates, oldest conversation first, until none are left."""
+        try:
+            while self._pending:
+                conversation_id = next(iter(self._pending))
+                fields = self._pending.pop(conversation_id)
+                self._writing = conversation_id
+                try:
+                    async with self._write_lock:
+                        await asyncio.to_thread(_apply_queued_update, conversation_id, fields)
+                except Exception as e:
+                    print(f"[ConversationWriter] Failed to save conversation {conversation_id}: {e}")
+                finally:
+                    self._writing = None
+                    written, self._written = self._written, asyncio.Event()
+                    written.set()
+        finally:
+            self._task = None
+
+
+def _apply_queued_update(conversation_id: str, fields: Dict[str, Any]):
+    """Apply one merged ConversationWriter update (runs in a worker thread)."""
+    title = fields.pop("title", None)
+    if fields:
+        save_partial_assistant_message(conversation_id, **fields)
+    if title is not None:
+        update_conversation_title(conversation_id, title)
+
+
+# Global writer instance
+conversation_writer = ConversationWriter()
+
+
 def delete_conversation(conversation_id: str) -> bool:
     """
     Delete a conversation from storage.
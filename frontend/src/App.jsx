@@ -208,20 +208,43 @@ function App() {
             }));
             break;
 
-          case 'speaker_complete':
-            setDebateState((prev) => ({
-              ...prev,
-              currentSpeaker: null,
-              turns: [
-                ...prev.turns,
-                {
+          case 'speaker_chunk':
+            setDebateState((prev) => {
+              const turns = [...prev.turns];
+              const last = turns[turns.length - 1];
+              if (last && last.isStreaming && last.model === event.model) {
+                turns[turns.length - 1] = { ...last, content: last.content + event.delta };
+              } else {
+                turns.push({
                   model: event.model,
                   name: event.name,
-                  content: event.content,
+                  content: event.delta,
                   turn_type: event.turn_type,
-                },
-              ],
-            }));
+                  isStreaming: true,
+                });
+              }
+              return { ...prev, turns };
+            });
+            break;
+
+          case 'speaker_complete':
+            setDebateState((prev) => {
+              const finalTurn = {
+                model: event.model,
+                name: event.name,
+                content: event.content,
+                turn_type: event.turn_type,
+              };
+              const turns = [...prev.turns];
+              const last = turns[turns.length - 1];
+              // Replace the streamed draft of this turn with the final text
+              if (last && last.isStreaming && last.model === event.model) {
+                turns[turns.length - 1] = finalTurn;
+              } else {
+                turns.push(finalTurn);
+              }
+              return { ...prev, currentSpeaker: null, turns };
+            });
             break;
 
           case 'moderator_decision':
@@ -358,6 +381,35 @@ function App() {
             });
             break;
 
+          case 'stage1_chunk':
+          case 'stage2_chunk': {
+            // Append the text a model streamed since the last frame. The message is
+            // replaced, not mutated, so a repeated updater (StrictMode) can't append twice
+            const streamsKey = event.type === 'stage1_chunk' ? 'model_streams' : 'stage2_streams';
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              const streams = lastMsg.progress?.[streamsKey] || {};
+              const stream = streams[event.model] || { content: '', status: 'streaming', char_count: 0 };
+              messages[messages.length - 1] = {
+                ...lastMsg,
+                progress: {
+                  ...lastMsg.progress,
+                  [streamsKey]: {
+                    ...streams,
+                    [event.model]: {
+                      ...stream,
+                      content: stream.content + event.content,
+                      char_count: stream.char_count + event.content.length,
+                    },
+                  },
+                },
+              };
+              return { ...prev, messages };
+            });
+            break;
+          }
+
           case 'stage1_complete':
             setCurrentConversation((prev) => {
               const messages = [...prev.messages];
@@ -419,6 +471,31 @@ function App() {
             });
             break;
 
+          case 'stage3_chunk':
+            // Append the synthesis text streamed since the last frame. The message is
+            // replaced, not mutated, so a repeated updater (StrictMode) can't append twice
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              const stream = lastMsg.progress?.stage3_stream || { content: '' };
+              messages[messages.length - 1] = {
+                ...lastMsg,
+                progress: {
+                  ...lastMsg.progress,
+                  stage3_stream: {
+                    ...stream,
+                    content: stream.content + event.content,
+                    status: event.status,
+                    char_count: event.char_count,
+                    model: event.model,
+                  },
+                },
+                loading: { ...lastMsg.loading, stage3: true },
+              };
+              return { ...prev, messages };
+            });
+            break;
+
           case 'stage3_complete':
             setCurrentConversation((prev) => {
               const messages = [...prev.messages];